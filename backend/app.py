@@ -3,15 +3,26 @@ Farcaster Mini App - Polymarket Trading Backend
 FastAPI server that handles wallet management and Polymarket trading
 """
 import os
+import asyncio
+import hashlib
+import secrets
 import logging
-from typing import Dict, Optional
-from fastapi import FastAPI, HTTPException, Header
+from datetime import datetime, timezone
+from typing import Annotated, AsyncIterator, Dict, List, Literal, Optional, Tuple
+import httpx
+import orjson
+import redis.asyncio as aioredis
+from cachetools import TTLCache
+from fastapi import Cookie, Depends, FastAPI, HTTPException, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, StringConstraints
 from dotenv import load_dotenv
 
 from wallet_utils import WalletManager
-from clob_client import PolymarketClient
+from clob_client import OrderBatcher, PolymarketClient
+from utils import get_current_15min_timestamp, get_seconds_until_next_15min
 
 # Load environment variables
 load_dotenv()
@@ -23,8 +34,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastAPI app
-app = FastAPI(title="Farcaster Polymarket Mini App")
+# Per-request access logs are pure overhead in production; keep app-level logs only
+if os.getenv("ENVIRONMENT", "development") == "production":
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+# Initialize FastAPI app (orjson for faster encoding of large market payloads)
+app = FastAPI(title="Farcaster Polymarket Mini App", default_response_class=ORJSONResponse)
 
 # CORS middleware for Farcaster Mini App
 app.add_middleware(
@@ -39,34 +54,80 @@ app.add_middleware(
 wallet_manager = WalletManager()
 polymarket_client = PolymarketClient()
 
-# In-memory session storage (use Redis/DB in production)
-sessions: Dict[str, Dict] = {}
+# Limit orders arriving within the window are posted to the CLOB as one batch
+ORDER_BATCH_WINDOW = float(os.getenv("ORDER_BATCH_WINDOW_MS", 50)) / 1000
+
+# Pull resting orders off the book when the server shuts down (the CLOB has no
+# server-side cancel-after timer to do this for us)
+CANCEL_ORDERS_ON_SHUTDOWN = os.getenv("CANCEL_ORDERS_ON_SHUTDOWN", "false").lower() == "true"
+
+# Session storage in Redis so sessions survive restarts and are shared across workers
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 3600))
+redis_pool = aioredis.ConnectionPool.from_url(
+    os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    max_connections=50
+)
+redis_client = aioredis.Redis(connection_pool=redis_pool)
+
+# Caps concurrent outbound Polymarket calls per worker so bursts don't stampede upstream
+CLOB_MAX_INFLIGHT = int(os.getenv("CLOB_MAX_INFLIGHT", 16))
+clob_semaphore = asyncio.Semaphore(CLOB_MAX_INFLIGHT)
+
+# /markets payload cached per 15-minute bucket: (bucket_timestamp, markets)
+_markets_cache: Optional[Tuple[int, List[Dict]]] = None
+_markets_lock = asyncio.Lock()
+
+# Cache lifetime for /markets/{token_id} responses (live prices)
+MARKET_DETAILS_MAX_AGE = int(os.getenv("MARKET_DETAILS_MAX_AGE", 5))
+
+# /markets/{token_id} micro-batching: requests arriving within the window share
+# one bulk CLOB fetch; identical token_ids in the same window share one future
+MARKET_DETAILS_BATCH_WINDOW = float(os.getenv("MARKET_DETAILS_BATCH_WINDOW_MS", 10)) / 1000
+MARKET_DETAILS_BATCH_MAX = 32
+_details_pending: Dict[str, asyncio.Future] = {}
+_details_flush_task: Optional[asyncio.Task] = None
 
-# In-memory Safe address cache (tracks deployed Safes by owner)
-safe_cache: Dict[str, str] = {}  # owner_address -> safe_address
+# /markets/next-refresh interval info per bucket: (bucket_timestamp, current, next)
+_interval_cache: Optional[Tuple[int, Dict, Dict]] = None
+
+# USDC balance lookups: in-flight futures shared per address, plus a short memo
+BALANCE_CACHE_TTL_SECONDS = float(os.getenv("BALANCE_CACHE_TTL_SECONDS", 2))
+_balance_inflight: Dict[str, asyncio.Future] = {}
+_balance_cache: TTLCache = TTLCache(maxsize=10_000, ttl=BALANCE_CACHE_TTL_SECONDS)  # address -> balance
+
+# Safe address cache (tracks deployed Safes by owner), bounded and expiring per worker;
+# the Redis hash below is the cross-worker source of truth
+safe_cache: TTLCache = TTLCache(maxsize=10_000, ttl=86400)  # owner_address -> safe_address
+SAFE_HASH_KEY = "safe"
+# Deployments in flight per owner on this worker; a Redis lock covers the other workers
+_safe_inflight: Dict[str, asyncio.Future] = {}
+SAFE_DEPLOY_LOCK_SECONDS = 180  # outlasts create_safe_proxy's 120s receipt wait
 
 
 # Pydantic models for request validation
+EthAddress = Annotated[str, StringConstraints(pattern=r'^0x[0-9a-fA-F]{40}$')]
+
+
 class ConnectRequest(BaseModel):
     """Request to connect wallet and authenticate"""
     fid: int  # Farcaster ID from Quick Auth
-    address: str  # User's wallet address from Farcaster
+    address: EthAddress  # User's wallet address from Farcaster
     signature: Optional[str] = None  # Optional signature for verification
 
 
 class DepositRequest(BaseModel):
     """Request to deposit funds to SafeProxy"""
     session_id: str
-    amount: float  # Amount in USDC
+    amount: float = Field(gt=0)  # Amount in USDC
 
 
 class OrderRequest(BaseModel):
     """Request to place an order"""
     session_id: str
     token_id: str  # Polymarket token ID
-    side: str  # "BUY" or "SELL"
-    price: float  # Price between 0.00 and 1.00
-    size: float  # Amount in USDC
+    side: Literal["BUY", "SELL"]
+    price: float = Field(gt=0, lt=1)  # Price between 0.00 and 1.00
+    size: float = Field(gt=0)  # Amount in USDC
 
 
 class CancelOrderRequest(BaseModel):
@@ -75,6 +136,206 @@ class CancelOrderRequest(BaseModel):
     order_id: Optional[str] = None  # If None, cancel all orders
 
 
+async def clob(fn, *args, **kwargs):
+    """Run a blocking Polymarket client call in the threadpool, bounded by clob_semaphore"""
+    async with clob_semaphore:
+        return await run_in_threadpool(fn, *args, **kwargs)
+
+
+# Batch POSTs go through clob() so they count against the same in-flight limit
+order_batcher = OrderBatcher(polymarket_client, interval=ORDER_BATCH_WINDOW, run=clob)
+
+
+async def _flush_market_details(delay: float = 0) -> None:
+    """Resolve every pending market-details future with one bulk CLOB fetch"""
+    global _details_flush_task
+    
+    if delay:
+        await asyncio.sleep(delay)
+    
+    batch = dict(_details_pending)
+    _details_pending.clear()
+    _details_flush_task = None
+    if not batch:
+        return
+    
+    try:
+        details = await clob(polymarket_client.get_market_details_bulk, list(batch))
+        for token_id, fut in batch.items():
+            if fut.done():
+                continue
+            # A token that failed on its own carries its exception instead of details
+            result = details.get(token_id)
+            if result is None:
+                fut.set_exception(Exception(f"No market details returned for {token_id}"))
+            elif isinstance(result, Exception):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+    except Exception as e:
+        for fut in batch.values():
+            if not fut.done():
+                fut.set_exception(e)
+
+
+async def get_market_details_batched(token_id: str) -> Dict:
+    """Queue a market-details lookup into the current batch window and await its result"""
+    global _details_flush_task
+    
+    fut = _details_pending.get(token_id)
+    if fut is None:
+        fut = asyncio.get_running_loop().create_future()
+        _details_pending[token_id] = fut
+        
+        if len(_details_pending) >= MARKET_DETAILS_BATCH_MAX:
+            if _details_flush_task:
+                _details_flush_task.cancel()
+            _details_flush_task = asyncio.create_task(_flush_market_details())
+        elif _details_flush_task is None:
+            _details_flush_task = asyncio.create_task(_flush_market_details(MARKET_DETAILS_BATCH_WINDOW))
+    
+    # Shield so one cancelled caller doesn't fail the others sharing this future
+    return await asyncio.shield(fut)
+
+
+def _session_key(session_id: str) -> str:
+    return f"sess:{session_id}"
+
+
+async def save_session(session_id: str, data: Dict) -> None:
+    """Store session data in Redis with a sliding expiry"""
+    await redis_client.set(_session_key(session_id), orjson.dumps(data), ex=SESSION_TTL_SECONDS)
+
+
+async def load_session(session_id: Optional[str]) -> Optional[Dict]:
+    """Load session data from Redis, or None if missing/expired"""
+    if not session_id:
+        return None
+    # GETEX refreshes the TTL on each read, which is what makes the expiry sliding
+    raw = await redis_client.getex(_session_key(session_id), ex=SESSION_TTL_SECONDS)
+    return orjson.loads(raw) if raw else None
+
+
+async def require_session(
+    session_id: Optional[str] = Header(None),
+    session_cookie: Optional[str] = Cookie(None, alias="session_id")
+) -> Dict:
+    """
+    Dependency resolving the caller's session from the session_id header or cookie
+    
+    Raises 401 before the handler runs if the session is missing or expired
+    """
+    session = await load_session(session_id or session_cookie)
+    if not session:
+        raise HTTPException(status_code=401, detail="Invalid session")
+    return session
+
+
+async def get_usdc_balance(address: str) -> float:
+    """
+    Get the USDC balance of an address, coalescing concurrent lookups
+    
+    Callers asking for the same address while a lookup is in flight share its
+    result, and results are reused for BALANCE_CACHE_TTL_SECONDS
+    """
+    key = address.lower()
+    
+    cached = _balance_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    fut = _balance_inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(wallet_manager.check_usdc_balance(address))
+        _balance_inflight[key] = fut
+        
+        def _done(f: asyncio.Future):
+            _balance_inflight.pop(key, None)
+            if not f.cancelled() and f.exception() is None:
+                _balance_cache[key] = f.result()
+        
+        fut.add_done_callback(_done)
+    
+    # Shield so one cancelled caller doesn't cancel the shared lookup
+    return await asyncio.shield(fut)
+
+
+async def get_or_create_safe(owner_address: str) -> str:
+    """
+    Return the owner's Safe, deploying one only if none is known
+    
+    Checks the local cache, then Redis, before paying for a deployment.
+    Concurrent calls for the same owner share one lookup/deployment
+    """
+    key = owner_address.lower()
+    
+    safe_address = safe_cache.get(key)
+    if safe_address:
+        return safe_address
+    
+    fut = _safe_inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(_lookup_or_deploy_safe(owner_address, key))
+        _safe_inflight[key] = fut
+        fut.add_done_callback(lambda f: _safe_inflight.pop(key, None))
+    
+    # Shield so one cancelled caller doesn't abandon a deployment others are waiting on
+    return await asyncio.shield(fut)
+
+
+async def _lookup_or_deploy_safe(owner_address: str, key: str) -> str:
+    """Read the owner's Safe from Redis, deploying it under a cross-worker lock if missing"""
+    raw = await redis_client.hget(SAFE_HASH_KEY, key)
+    if not raw:
+        async with redis_client.lock(
+            f"{SAFE_HASH_KEY}:deploy:{key}",
+            timeout=SAFE_DEPLOY_LOCK_SECONDS,
+            blocking_timeout=SAFE_DEPLOY_LOCK_SECONDS
+        ):
+            # Another worker may have deployed while we waited for the lock
+            raw = await redis_client.hget(SAFE_HASH_KEY, key)
+            if not raw:
+                deployed = await wallet_manager.create_safe_proxy(owner_address)
+                if await redis_client.hsetnx(SAFE_HASH_KEY, key, deployed):
+                    raw = deployed.encode()
+                else:
+                    raw = await redis_client.hget(SAFE_HASH_KEY, key)
+    
+    safe_address = raw.decode()
+    safe_cache[key] = safe_address
+    return safe_address
+
+
+@app.on_event("startup")
+async def open_http_client():
+    """Create the shared keep-alive HTTP client for outbound RPC traffic and start the order batcher"""
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+    )
+    wallet_manager.http = app.state.http
+    order_batcher.start()
+
+
+@app.on_event("shutdown")
+async def close_connections():
+    """Flush queued orders and release pooled HTTP, CLOB and Redis connections"""
+    await order_batcher.stop()
+    # trade_client_ready doesn't block on a slow credential derivation; if it never
+    # finished, no orders could have been placed through this worker anyway
+    if CANCEL_ORDERS_ON_SHUTDOWN and polymarket_client.trade_client_ready:
+        try:
+            await clob(polymarket_client.cancel_all_orders)
+        except Exception as e:
+            logger.error("Error cancelling orders on shutdown: %s", e)
+    polymarket_client.close()
+    await wallet_manager.close()
+    wallet_manager.http = None
+    await app.state.http.aclose()
+    await redis_client.aclose()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -86,7 +347,7 @@ async def root():
 
 
 @app.post("/connect")
-async def connect_wallet(request: ConnectRequest):
+async def connect_wallet(request: ConnectRequest, response: Response):
     """
     Connect user wallet and create SafeProxy on Polygon
     
@@ -96,29 +357,33 @@ async def connect_wallet(request: ConnectRequest):
     3. Initializes a trading session
     """
     try:
-        logger.info(f"Connection request from FID: {request.fid}, Address: {request.address}")
-        
-        # Validate address format
-        if not request.address.startswith('0x') or len(request.address) != 42:
-            raise HTTPException(status_code=400, detail="Invalid Ethereum address")
+        logger.info("Connection request FID=%s addr=%s", request.fid, request.address)
         
         # Create or retrieve SafeProxy wallet
-        safe_address = await wallet_manager.create_safe_proxy(request.address)
+        safe_address = await get_or_create_safe(request.address)
         
-        # Generate session ID
-        session_id = f"session_{request.fid}_{request.address[:10]}"
+        # Generate an unguessable session ID (fid/address live in the session value)
+        session_id = secrets.token_urlsafe(24)
         
         # Store session data
-        sessions[session_id] = {
+        await save_session(session_id, {
             "fid": request.fid,
             "owner_address": request.address,
             "safe_address": safe_address,
             "authenticated": True
-        }
-        
-        logger.info(f"✅ Connected wallet for FID {request.fid}")
-        logger.info(f"   Owner Address: {request.address}")
-        logger.info(f"   SafeProxy: {safe_address}")
+        })
+        
+        logger.info("Connected wallet FID=%s owner=%s safe=%s", request.fid, request.address, safe_address)
+        
+        # Also hand the session out as a cookie so GET endpoints don't need the custom header
+        response.set_cookie(
+            "session_id",
+            session_id,
+            max_age=SESSION_TTL_SECONDS,
+            httponly=True,
+            secure=True,
+            samesite="none"
+        )
         
         return {
             "success": True,
@@ -128,7 +393,7 @@ async def connect_wallet(request: ConnectRequest):
         }
         
     except Exception as e:
-        logger.error(f"Error connecting wallet: {str(e)}")
+        logger.error("Error connecting wallet: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -142,20 +407,15 @@ async def deposit_funds(request: DepositRequest):
     """
     try:
         # Validate session
-        if request.session_id not in sessions:
+        session = await load_session(request.session_id)
+        if not session:
             raise HTTPException(status_code=401, detail="Invalid session")
-        
-        session = sessions[request.session_id]
         safe_address = session["safe_address"]
         
-        logger.info(f"Processing deposit of {request.amount} USDC")
-        logger.info(f"   To SafeProxy: {safe_address}")
-        
         # Check balance (this would normally query the blockchain)
-        balance = await wallet_manager.check_usdc_balance(safe_address)
+        balance = await get_usdc_balance(safe_address)
         
-        logger.info(f"✅ Deposit instructions sent")
-        logger.info(f"   Current USDC balance: {balance}")
+        logger.info("Deposit of %s USDC to %s requested (balance=%s)", request.amount, safe_address, balance)
         
         return {
             "success": True,
@@ -165,34 +425,81 @@ async def deposit_funds(request: DepositRequest):
         }
         
     except Exception as e:
-        logger.error(f"Error processing deposit: {str(e)}")
+        logger.error("Error processing deposit: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def get_cached_featured_markets() -> List[Dict]:
+    """
+    Return featured markets, fetching from Polymarket at most once per 15-minute bucket
+    
+    Concurrent cache misses wait on the same lock so only one upstream fetch runs
+    """
+    global _markets_cache
+    
+    bucket = get_current_15min_timestamp()
+    if _markets_cache and _markets_cache[0] == bucket:
+        return _markets_cache[1]
+    
+    async with _markets_lock:
+        # Another request may have refreshed the cache while we waited
+        if _markets_cache and _markets_cache[0] == bucket:
+            return _markets_cache[1]
+        
+        # Get simplified markets from Polymarket
+        # This will ONLY return markets matching FEATURED_MARKETS in .env
+        markets = await clob(polymarket_client.get_featured_markets, 10)  # Higher limit to find all featured
+        
+        logger.info("Retrieved %d markets", len(markets))
+        
+        # Don't pin an empty result for the whole interval
+        if markets:
+            _markets_cache = (bucket, markets)
+        return markets
+
+
+async def _stream_markets(markets: List[Dict]) -> AsyncIterator[bytes]:
+    """Encode the /markets payload one market at a time (async, so no threadpool hop per chunk)"""
+    yield b'{"success":true,"markets":['
+    for i, market in enumerate(markets):
+        yield (b"," if i else b"") + orjson.dumps(market)
+    yield b"]}"
+
+
 @app.get("/markets")
-async def get_markets():
+async def get_markets(request: Request):
     """
     Retrieve available Polymarket markets
     
     Returns ONLY the markets specified in FEATURED_MARKETS from .env
+    Responses are cacheable until the next 15-minute boundary
     """
     try:
+        etag = f'W/"{get_current_15min_timestamp()}"'
+        cache_headers = {
+            "Cache-Control": f"public, max-age={get_seconds_until_next_15min()}",
+            "ETag": etag
+        }
+        
+        # Client already has this bucket's markets
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
+        
         logger.info("Fetching available markets")
         
-        # Get simplified markets from Polymarket
-        # This will ONLY return markets matching FEATURED_MARKETS in .env
-        markets = polymarket_client.get_featured_markets(limit=10)  # Higher limit to find all featured
+        markets = await get_cached_featured_markets()
         
-        logger.info(f"✅ Retrieved {len(markets)} markets")
-        logger.info(f"📊 Market condition IDs: {[m.get('condition_id', 'N/A') for m in markets]}")
+        # Empty results aren't cached server-side, so don't let clients cache them either
+        headers = cache_headers if markets else {"Cache-Control": "no-store"}
         
-        return {
-            "success": True,
-            "markets": markets
-        }
+        return StreamingResponse(
+            _stream_markets(markets),
+            media_type="application/json",
+            headers=headers
+        )
         
     except Exception as e:
-        logger.error(f"Error fetching markets: {str(e)}")
+        logger.error("Error fetching markets: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -201,33 +508,34 @@ async def get_next_refresh_time():
     """
     Get time until next 15-minute market refresh
     """
+    global _interval_cache
+    
     try:
-        from utils import get_current_15min_timestamp, get_next_15min_timestamp, get_seconds_until_next_15min
-        
         current_timestamp = get_current_15min_timestamp()
-        next_timestamp = get_next_15min_timestamp()
         seconds_until = get_seconds_until_next_15min()
         
-        from datetime import datetime, timezone
-        current_time = datetime.fromtimestamp(current_timestamp, timezone.utc)
-        next_time = datetime.fromtimestamp(next_timestamp, timezone.utc)
+        # Interval info only changes at bucket boundaries, so reuse it within a bucket
+        if not _interval_cache or _interval_cache[0] != current_timestamp:
+            next_timestamp = current_timestamp + 900
+            _interval_cache = (current_timestamp, {
+                "timestamp": current_timestamp,
+                "datetime": datetime.fromtimestamp(current_timestamp, timezone.utc).isoformat()
+            }, {
+                "timestamp": next_timestamp,
+                "datetime": datetime.fromtimestamp(next_timestamp, timezone.utc).isoformat()
+            })
+        _, current_interval, next_interval = _interval_cache
         
         return {
             "success": True,
-            "current_interval": {
-                "timestamp": current_timestamp,
-                "datetime": current_time.isoformat()
-            },
-            "next_interval": {
-                "timestamp": next_timestamp,
-                "datetime": next_time.isoformat()
-            },
+            "current_interval": current_interval,
+            "next_interval": next_interval,
             "seconds_until_next": seconds_until,
             "minutes_until_next": seconds_until // 60,
             "has_15min_markets": polymarket_client.has_15min_markets
         }
     except Exception as e:
-        logger.error(f"Error in next-refresh endpoint: {str(e)}")
+        logger.error("Error in next-refresh endpoint: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -241,27 +549,42 @@ async def debug_markets():
         featured_ids = polymarket_client.featured_conditions
         logger.info("🔍 Debug: Checking featured markets")
         
-        # Test fetching each condition_id
+        # One CLOB listing fetch, indexed by condition_id for O(1) lookups
+        markets_response = await clob(polymarket_client.read_client.get_simplified_markets)
+        clob_markets = markets_response.get("data", []) if markets_response else []
+        by_cid = {m.get("condition_id"): m for m in clob_markets}
+        
+        # Only identifiers missing from the listing (e.g. slugs) need their own lookup,
+        # run concurrently (featured_conditions is already stripped and de-duplicated)
+        missing = [cid for cid in featured_ids if cid not in by_cid]
+        fallback_results = await asyncio.gather(
+            *[
+                clob(polymarket_client._fetch_market_by_slug_or_condition_id, cid)
+                for cid in missing
+            ],
+            return_exceptions=True
+        )
+        fallback = dict(zip(missing, fallback_results))
+        
         test_results = []
         for cid in featured_ids:
-            try:
-                market = polymarket_client._fetch_market_by_condition_id(cid.strip())
+            market = by_cid[cid] if cid in by_cid else fallback[cid]
+            if isinstance(market, Exception):
                 test_results.append({
                     "condition_id": cid,
-                    "found": market is not None,
-                    "question": market.get("question", "")[:50] if market else None,
-                    "active": market.get("active", False) if market else False
+                    "found": False,
+                    "error": str(market)
                 })
-            except Exception as e:
+            else:
                 test_results.append({
                     "condition_id": cid,
-                    "found": False,
-                    "error": str(e)
+                    "found": market is not None,
+                    "question": market.get("question", "")[:50] if market else None,
+                    "active": market.get("active", False) if market else False
                 })
         
-        # Get a sample of markets from CLOB API to see format
-        markets_response = polymarket_client.read_client.get_simplified_markets()
-        sample_markets = markets_response.get("data", [])[:10] if markets_response else []
+        # Sample of markets from CLOB API to see format
+        sample_markets = clob_markets[:10]
         
         return {
             "success": True,
@@ -276,22 +599,23 @@ async def debug_markets():
             ]
         }
     except Exception as e:
-        logger.error(f"Error in debug endpoint: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.error("Error in debug endpoint: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/markets/{token_id}")
-async def get_market_details(token_id: str):
+async def get_market_details(token_id: str, response: Response):
     """
     Get detailed information about a specific market
     """
     try:
-        logger.info(f"Fetching details for token: {token_id}")
+        logger.info("Fetching details for token: %s", token_id)
         
         # Get market data
-        details = polymarket_client.get_market_details(token_id)
+        details = await get_market_details_batched(token_id)
+        
+        # Prices move continuously, so only allow a short client/CDN cache
+        response.headers["Cache-Control"] = f"public, max-age={MARKET_DETAILS_MAX_AGE}"
         
         return {
             "success": True,
@@ -299,7 +623,7 @@ async def get_market_details(token_id: str):
         }
         
     except Exception as e:
-        logger.error(f"Error fetching market details: {str(e)}")
+        logger.error("Error fetching market details: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -312,38 +636,24 @@ async def place_order(request: OrderRequest):
     """
     try:
         # Validate session
-        if request.session_id not in sessions:
+        session = await load_session(request.session_id)
+        if not session:
             raise HTTPException(status_code=401, detail="Invalid session")
         
-        session = sessions[request.session_id]
-        
-        # Validate order parameters
-        if request.side not in ["BUY", "SELL"]:
-            raise HTTPException(status_code=400, detail="Side must be BUY or SELL")
-        
-        if not (0 < request.price < 1):
-            raise HTTPException(status_code=400, detail="Price must be between 0 and 1")
-        
-        if request.size <= 0:
-            raise HTTPException(status_code=400, detail="Size must be positive")
-        
-        logger.info(f"📊 Placing {request.side} order")
-        logger.info(f"   Token: {request.token_id}")
-        logger.info(f"   Price: ${request.price}")
-        logger.info(f"   Size: {request.size} USDC")
-        
-        # Place the order via Polymarket CLOB
-        order_response = polymarket_client.place_limit_order(
-            token_id=request.token_id,
-            side=request.side,
-            price=request.price,
-            size=request.size
+        # Place the order via Polymarket CLOB (coalesced with concurrent orders)
+        order_response = await order_batcher.submit({
+            "token_id": request.token_id,
+            "side": request.side,
+            "price": request.price,
+            "size": request.size
+        })
+        
+        logger.info(
+            "Order placed side=%s token=%s price=%s size=%s id=%s status=%s",
+            request.side, request.token_id, request.price, request.size,
+            order_response.get("orderID", "N/A"), order_response.get("status", "N/A")
         )
         
-        logger.info(f"✅ Order placed successfully")
-        logger.info(f"   Order ID: {order_response.get('orderID', 'N/A')}")
-        logger.info(f"   Status: {order_response.get('status', 'N/A')}")
-        
         return {
             "success": True,
             "order": order_response,
@@ -351,7 +661,7 @@ async def place_order(request: OrderRequest):
         }
         
     except Exception as e:
-        logger.error(f"Error placing order: {str(e)}")
+        logger.error("Error placing order: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -362,19 +672,19 @@ async def cancel_order(request: CancelOrderRequest):
     """
     try:
         # Validate session
-        if request.session_id not in sessions:
+        if not await load_session(request.session_id):
             raise HTTPException(status_code=401, detail="Invalid session")
         
         if request.order_id:
-            logger.info(f"Cancelling order: {request.order_id}")
-            result = polymarket_client.cancel_order(request.order_id)
+            logger.info("Cancelling order: %s", request.order_id)
+            result = await clob(polymarket_client.cancel_order, request.order_id)
             message = f"Order {request.order_id} cancelled"
         else:
             logger.info("Cancelling all orders")
-            result = polymarket_client.cancel_all_orders()
+            result = await clob(polymarket_client.cancel_all_orders)
             message = "All orders cancelled"
         
-        logger.info(f"✅ {message}")
+        logger.info("%s", message)
         
         return {
             "success": True,
@@ -383,50 +693,47 @@ async def cancel_order(request: CancelOrderRequest):
         }
         
     except Exception as e:
-        logger.error(f"Error cancelling order: {str(e)}")
+        logger.error("Error cancelling order: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/orders")
-async def get_orders(session_id: str = Header(None)):
+async def get_orders(request: Request, session: Dict = Depends(require_session)):
     """
     Get user's open orders
+    
+    Tagged with a content hash ETag so unchanged polls get an empty 304
     """
     try:
-        # Validate session
-        if session_id not in sessions:
-            raise HTTPException(status_code=401, detail="Invalid session")
-        
         logger.info("Fetching open orders")
         
-        orders = polymarket_client.get_open_orders()
+        orders = await clob(polymarket_client.get_open_orders)
         
-        logger.info(f"✅ Retrieved {len(orders)} open orders")
+        logger.info("Retrieved %d open orders", len(orders))
         
-        return {
-            "success": True,
-            "orders": orders
-        }
+        body = orjson.dumps({"success": True, "orders": orders})
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
-        logger.error(f"Error fetching orders: {str(e)}")
+        logger.error("Error fetching orders: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/balance")
-async def get_balance(session_id: str = Header(None)):
+async def get_balance(session: Dict = Depends(require_session)):
     """
     Get user's USDC balance in SafeProxy
     """
     try:
-        # Validate session
-        if session_id not in sessions:
-            raise HTTPException(status_code=401, detail="Invalid session")
-        
-        session = sessions[session_id]
         safe_address = session["safe_address"]
         
-        balance = await wallet_manager.check_usdc_balance(safe_address)
+        balance = await get_usdc_balance(safe_address)
         
         return {
             "success": True,
@@ -435,7 +742,7 @@ async def get_balance(session_id: str = Header(None)):
         }
         
     except Exception as e:
-        logger.error(f"Error fetching balance: {str(e)}")
+        logger.error("Error fetching balance: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -445,8 +752,23 @@ if __name__ == "__main__":
     # Get port from environment or use default
     port = int(os.getenv("PORT", 8000))
     
+    # One worker per core by default; sessions live in Redis so workers share them
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    environment = os.getenv("ENVIRONMENT", "development")
+    
     logger.info("🚀 Starting Farcaster Polymarket Mini App Backend")
-    logger.info(f"   Port: {port}")
-    logger.info(f"   Environment: {os.getenv('ENVIRONMENT', 'development')}")
+    logger.info("   Port: %s", port)
+    logger.info("   Workers: %s", workers)
+    logger.info("   Environment: %s", environment)
     
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    # "auto" loop picks uvloop when installed (uvicorn[standard], non-Windows)
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="httptools",
+        # Access logs for high-frequency polls belong to the reverse proxy in production
+        access_log=environment != "production"
+    )
\ No newline at end of file
@@ -3,12 +3,27 @@ Polymarket CLOB Client
 Handles market data fetching and order placement using py-clob-client
 """
 import os
+import re
+import time
+import asyncio
 import logging
+import socket
+import threading
+import httpx
+import ijson
+import orjson
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple, Union
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, MarketOrderArgs, OrderType, OpenOrderParams, BookParams
+from py_clob_client.clob_types import (
+    OrderArgs, MarketOrderArgs, OrderType, OpenOrderParams, BookParams, PostOrdersArgs
+)
 from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.http_helpers import helpers as clob_http
 from utils import (
     get_current_15min_timestamp,
     update_slug_with_current_timestamp,
@@ -18,10 +33,100 @@ from utils import (
 
 logger = logging.getLogger(__name__)
 
+# eth-keys (used by py-clob-client to sign orders) switches to libsecp256k1 when
+# coincurve is importable; without it every EIP-712 signature is pure Python
+try:
+    import coincurve  # noqa: F401
+except ImportError:
+    logger.warning("⚠️  coincurve not installed - order signing will use the slow pure-Python backend")
+
 # Polymarket configuration
 CLOB_HOST = "https://clob.polymarket.com"
 GAMMA_API = "https://gamma-api.polymarket.com"  # Gamma API for market data
 CHAIN_ID = 137  # Polygon
+MAX_BATCH_ORDERS = 15  # CLOB limit on orders per batch POST
+ACCOUNT_CACHE_TTL = 2  # seconds open orders / trades are reused between polls
+CLOB_KEEPALIVE_INTERVAL = 30  # seconds between pings that keep pooled CLOB connections warm
+
+
+class _OrjsonClient(httpx.Client):
+    """
+    httpx client whose responses decode JSON with orjson
+    
+    Request bodies are left to py-clob-client: L2 auth signs the exact body
+    string it serializes, so re-encoding it here would break the HMAC
+    """
+    
+    def request(self, *args, **kwargs) -> httpx.Response:
+        response = super().request(*args, **kwargs)
+        # orjson.JSONDecodeError subclasses ValueError, so callers' fallbacks still apply
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+
+def _install_clob_transport() -> bool:
+    """
+    Swap py-clob-client's module-level HTTP client for a tuned, long-lived one
+    
+    Every ClobClient request goes through clob_http._http_client, so one shared
+    HTTP/2 pool with TCP keepalive and TCP_NODELAY serves both the read and the
+    trading client (small order payloads shouldn't wait on Nagle), and responses
+    are parsed with orjson
+    
+    Orders can only be submitted over REST: the CLOB's WebSocket channels
+    (market/user) are read-only feeds, so this pool is the order transport
+    
+    Requires py-clob-client >= 0.34 (earlier releases call requests directly)
+    
+    Returns:
+        True if the shared client was replaced
+    """
+    if not hasattr(clob_http, "_http_client"):
+        logger.error("❌ Installed py-clob-client has no shared HTTP client (need >= 0.34); "
+                     "CLOB requests will not be pooled")
+        return False
+    
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        socket_options=socket_options
+    )
+    
+    previous = clob_http._http_client
+    clob_http._http_client = _OrjsonClient(transport=transport, timeout=5.0)
+    previous.close()
+    return True
+
+
+def _iter_list_items(stream):
+    """
+    Stream the objects of a Gamma list response, whether it's a bare array or {"data": [...]}
+    
+    The top-level type is taken from the first parse event, so nothing is buffered
+    """
+    events = ijson.parse(stream, use_float=True)
+    _, first_event, _ = next(events, (None, None, None))
+    item_prefix = "item" if first_event == "start_array" else "data.item"
+    
+    builder = None
+    for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event in ("end_map", "end_array"):
+                yield builder.value
+                builder = None
+        elif prefix == item_prefix and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+
+
+def _looks_like_slug(identifier: str) -> bool:
+    """Slugs typically contain hyphens and don't start with 0x (condition_ids do)"""
+    return "-" in identifier and not identifier.startswith("0x")
 
 
 class PolymarketClient:
@@ -37,57 +142,157 @@ class PolymarketClient:
         funder_address = os.getenv("POLYMARKET_FUNDER_ADDRESS")
         signature_type = int(os.getenv("POLYMARKET_SIGNATURE_TYPE", "1"))
         
+        # Shared keep-alive HTTP/2 transport for all CLOB requests
+        self._pooled_transport = _install_clob_transport()
+        
         # Initialize read-only client (no auth needed for market data)
         self.read_client = ClobClient(CLOB_HOST)
         logger.info("✅ Initialized read-only Polymarket client")
         
-        # Initialize authenticated client if credentials are available
+        # Build the authenticated client in the background: deriving API credentials is a
+        # network round-trip, so startup and read-only paths shouldn't wait on it
         if private_key and funder_address:
-            try:
-                self.trade_client = ClobClient(
-                    CLOB_HOST,
-                    key=private_key,
-                    chain_id=CHAIN_ID,
-                    signature_type=signature_type,
-                    funder=funder_address
-                )
-                
-                # Create or derive API credentials
-                self.trade_client.set_api_creds(
-                    self.trade_client.create_or_derive_api_creds()
-                )
-                
-                logger.info("✅ Initialized authenticated Polymarket client")
-                logger.info(f"   Funder: {funder_address}")
-                logger.info(f"   Signature Type: {signature_type}")
-                
-            except Exception as e:
-                logger.error(f"Failed to initialize trading client: {e}")
-                self.trade_client = None
+            auth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clob-auth")
+            self._trade_client_future = auth_executor.submit(
+                self._build_trade_client, private_key, funder_address, signature_type
+            )
+            auth_executor.shutdown(wait=False)
         else:
             logger.warning("⚠️  No trading credentials found. Trading will be disabled.")
-            self.trade_client = None
+            self._trade_client_future = None
+        
+        # Persistent keep-alive session for Gamma API requests
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ))
+        self._http.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": "polybet/1.0"})
+        
+        # Gamma API response caches (shared across worker threads, guarded by _cache_lock)
+        self._cache_lock = threading.Lock()
+        self._slug_cache = TTLCache(maxsize=512, ttl=60)
+        self._slug_cache_15m = TTLCache(maxsize=512, ttl=300)  # 15-min interval market slugs
+        self._missing_slugs = TTLCache(maxsize=512, ttl=10)  # negative cache for 404s
+        self._pattern_cache = TTLCache(maxsize=128, ttl=900)  # (pattern, interval) -> active market
+        self._order_constraints = TTLCache(maxsize=1024, ttl=300)  # token_id -> (tick size, min order size)
+        self._account_cache = TTLCache(maxsize=4, ttl=ACCOUNT_CACHE_TTL)  # "orders" / "trades" -> list
+        
+        # Worker pool for fanning out independent Gamma API lookups
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gamma")
+        
+        # Separate pool for interval-slug probes, which run from inside _executor tasks
+        # (sharing one pool could deadlock with every worker waiting on queued probes)
+        self._probe_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gamma-probe")
+        
+        # Worker pool for concurrent CLOB read requests (order books, prices, ...)
+        self._clob_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clob")
+        
+        # Worker pool for signing batched orders (kept apart from reads so they don't queue)
+        self._sign_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clob-sign")
+        
+        # Idle connections get reaped upstream; ping periodically so orders reuse a warm one
+        # (only meaningful with the pooled client - otherwise each ping is a fresh connection)
+        self._keepalive_stop = threading.Event()
+        if self._pooled_transport:
+            threading.Thread(target=self._keepalive_loop, name="clob-keepalive", daemon=True).start()
         
         # Load featured markets from environment
+        # Parsed once: stripped, de-duplicated, in configured order
         featured_env = os.getenv("FEATURED_MARKETS", "")
         if featured_env:
-            self.featured_conditions = [
+            self.featured_conditions = tuple(dict.fromkeys(
                 cid.strip() for cid in featured_env.split(",") if cid.strip()
-            ]
+            ))
             logger.info(f"📌 Loaded {len(self.featured_conditions)} featured markets from .env")
             
+            # Classify each identifier once: (identifier, is_slug, is_15min)
+            self._featured_parsed = [
+                (cid, _looks_like_slug(cid), is_15min_interval_market(cid))
+                for cid in self.featured_conditions
+            ]
+            
             # Check for 15-minute interval markets
-            self.has_15min_markets = any(
-                is_15min_interval_market(cid) for cid in self.featured_conditions
-            )
+            self.has_15min_markets = any(is_15min for _, _, is_15min in self._featured_parsed)
             if self.has_15min_markets:
                 logger.info("🔄 Detected 15-minute interval markets - will auto-update every 15 minutes")
         else:
-            self.featured_conditions = []
+            self.featured_conditions = ()
+            self._featured_parsed = []
             self.has_15min_markets = False
             logger.warning("⚠️  No FEATURED_MARKETS set in .env, will show random markets")
     
-    def _fetch_market_by_slug(self, slug: str) -> Optional[Dict]:
+    def _build_trade_client(
+        self,
+        private_key: str,
+        funder_address: str,
+        signature_type: int
+    ) -> Optional[ClobClient]:
+        """
+        Create the authenticated CLOB client and derive its API credentials
+        
+        Returns:
+            The trading client, or None if initialization failed
+        """
+        try:
+            trade_client = ClobClient(
+                CLOB_HOST,
+                key=private_key,
+                chain_id=CHAIN_ID,
+                signature_type=signature_type,
+                funder=funder_address
+            )
+            
+            # Create or derive API credentials
+            trade_client.set_api_creds(
+                trade_client.create_or_derive_api_creds()
+            )
+            
+            logger.info("✅ Initialized authenticated Polymarket client")
+            logger.info(f"   Funder: {funder_address}")
+            logger.info(f"   Signature Type: {signature_type}")
+            
+            return trade_client
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize trading client: {e}")
+            return None
+    
+    @property
+    def trade_client(self) -> Optional[ClobClient]:
+        """Authenticated CLOB client (blocks until background init finishes), or None if unavailable"""
+        if self._trade_client_future is None:
+            return None
+        return self._trade_client_future.result()
+    
+    @property
+    def trade_client_ready(self) -> bool:
+        """Whether the authenticated client finished initializing successfully (never blocks)"""
+        future = self._trade_client_future
+        return (
+            future is not None
+            and future.done()
+            and future.exception() is None
+            and future.result() is not None
+        )
+    
+    def _keepalive_loop(self) -> None:
+        """Ping the CLOB every CLOB_KEEPALIVE_INTERVAL seconds until closed"""
+        while not self._keepalive_stop.wait(CLOB_KEEPALIVE_INTERVAL):
+            try:
+                self.read_client.get_ok()
+            except Exception as e:
+                logger.debug(f"CLOB keepalive ping failed: {e}")
+    
+    def close(self) -> None:
+        """Stop the keepalive pinger and release pooled connections"""
+        self._keepalive_stop.set()
+        self._http.close()
+        if self._pooled_transport:
+            clob_http._http_client.close()
+    
+    def _fetch_market_by_slug(self, slug: str, use_cache: bool = True) -> Optional[Dict]:
         """
         Fetch a market by slug using Gamma API
         Uses the official endpoint: GET /markets/slug/{slug}
@@ -96,26 +301,49 @@ class PolymarketClient:
         
         Args:
             slug: Market slug (e.g., 'btc-updown-15m-1761921000')
+            use_cache: Read and write the slug caches (off for neighbouring-interval
+                       probes, whose active/closed state changes at the boundary)
         
         Returns:
             Market data if found, None otherwise
         """
         try:
             slug_clean = slug.strip()
+            
+            # Serve from cache (including recent 404s) before going to the network
+            cache = self._slug_cache_15m if is_15min_interval_market(slug_clean) else self._slug_cache
+            if use_cache:
+                with self._cache_lock:
+                    if slug_clean in cache:
+                        return cache[slug_clean]
+                    if slug_clean in self._missing_slugs:
+                        return None
+            
             logger.info(f"   🌐 Fetching market by slug: {slug_clean[:50]}...")
             
             # Use official Gamma API endpoint for slug-based lookup
             url = f"{GAMMA_API}/markets/slug/{slug_clean}"
             logger.info(f"   📡 Requesting: {url}")
             
-            response = requests.get(url, timeout=10)
+            # Error bodies are never parsed; only a 2xx body is decoded
+            response = self._http.get(url, timeout=10)
             
             if response.status_code == 404:
                 logger.warning(f"   ⚠️  Market not found (404) for slug: {slug_clean[:50]}...")
+                if use_cache:
+                    with self._cache_lock:
+                        self._missing_slugs[slug_clean] = True
                 return None
             
-            response.raise_for_status()
-            market = response.json()
+            if not response.ok:
+                logger.warning(f"   ⚠️  HTTP error: {response.status_code} {response.reason}")
+                return None
+            
+            market = orjson.loads(response.content)
+            
+            if use_cache:
+                with self._cache_lock:
+                    cache[slug_clean] = market
             
             # Check if market is active
             is_active = market.get("active", True) and not market.get("closed", False)
@@ -130,25 +358,53 @@ class PolymarketClient:
             
             return market
             
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.warning(f"   ⚠️  Market not found (404): {slug_clean[:50]}...")
-            else:
-                logger.warning(f"   ⚠️  HTTP error: {e.response.status_code} - {e.response.text[:100]}")
-            return None
         except Exception as e:
             logger.warning(f"   ⚠️  Error fetching market by slug {slug[:30]}...: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Error details", exc_info=True)
             return None
     
-    def _fetch_active_market_by_pattern(self, slug_pattern: str) -> Optional[Dict]:
+    def _fetch_active_market_by_pattern(
+        self,
+        slug_pattern: str,
+        current_timestamp: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Fetch the current active market by slug pattern, cached per 15-minute interval
+        
+        Args:
+            slug_pattern: Base slug pattern like 'btc-updown-15m' or 'btc-updown-15m-1761921000'
+            current_timestamp: Current 15-minute interval timestamp (computed if None)
+        
+        Returns:
+            The most recent active market matching the pattern
+        """
+        if current_timestamp is None:
+            current_timestamp = get_current_15min_timestamp()
+        
+        cache_key = (slug_pattern, current_timestamp)
+        with self._cache_lock:
+            if cache_key in self._pattern_cache:
+                return self._pattern_cache[cache_key]
+        
+        market = self._search_active_market_by_pattern(slug_pattern, current_timestamp)
+        
+        # Only pin a market whose interval hasn't ended: an earlier interval's market can
+        # still read as active briefly after it closes, and must not stick for the bucket
+        if market:
+            market_timestamp = extract_timestamp_from_slug(market.get("slug") or "")
+            if market_timestamp is None or market_timestamp + 900 > current_timestamp:
+                with self._cache_lock:
+                    self._pattern_cache[cache_key] = market
+        return market
+    
+    def _search_active_market_by_pattern(self, slug_pattern: str, current_timestamp: int) -> Optional[Dict]:
         """
         Fetch the current active market by slug pattern
-        For 15-minute markets, tries slug with current timestamp, then searches if not found
+        For 15-minute markets, probes slugs around the current timestamp, then searches if not found
         
         Args:
             slug_pattern: Base slug pattern like 'btc-updown-15m' or 'btc-updown-15m-1761921000'
+            current_timestamp: Current 15-minute interval timestamp
         
         Returns:
             The most recent active market matching the pattern
@@ -164,62 +420,63 @@ class PolymarketClient:
             
             logger.info(f"   🔍 Searching for active market with pattern: {base_pattern}")
             
-            # First, try to fetch with current timestamp (most likely to be active)
-            current_timestamp = get_current_15min_timestamp()
-            current_slug = f"{base_pattern}-{current_timestamp}"
-            
-            logger.info(f"   📡 Trying current interval slug: {current_slug[:50]}...")
-            market = self._fetch_market_by_slug(current_slug)
-            
-            if market:
-                is_active = market.get("active", True) and not market.get("closed", False)
-                if is_active:
-                    logger.info(f"   ✅ Found active market for current interval!")
-                    return market
-                else:
-                    logger.warning(f"   ⚠️  Current interval market is closed, searching alternatives...")
-            
-            # If current timestamp doesn't work, try recent timestamps (within last hour)
-            logger.info(f"   🔄 Searching for active market in recent intervals...")
-            
-            # Try next few intervals (forward and backward)
-            for offset in [-900, -1800, 0, 900]:  # -15min, -30min, current, +15min
-                test_timestamp = current_timestamp + offset
-                test_slug = f"{base_pattern}-{test_timestamp}"
-                logger.info(f"   📡 Trying slug: {test_slug[:50]}...")
-                
-                market = self._fetch_market_by_slug(test_slug)
-                if market:
-                    is_active = market.get("active", True) and not market.get("closed", False)
-                    if is_active:
+            # Probe the current interval and its neighbours concurrently, in priority order:
+            # current (most likely to be active), -15min, -30min, +15min
+            offsets = (0, -900, -1800, 900)
+            probe_slugs = [f"{base_pattern}-{current_timestamp + offset}" for offset in offsets]
+            logger.info(f"   📡 Probing {len(probe_slugs)} interval slugs for: {base_pattern}")
+            
+            # Only the current interval's lookup is cached; a neighbour's cached state
+            # (e.g. last interval still "active") would be stale across the boundary
+            probes = [
+                self._probe_executor.submit(self._fetch_market_by_slug, slug, offset == 0)
+                for slug, offset in zip(probe_slugs, offsets)
+            ]
+            try:
+                # Walk in priority order so the preferred interval still wins, but return
+                # as soon as it is known without waiting on lower-priority probes
+                for test_slug, probe in zip(probe_slugs, probes):
+                    market = probe.result()
+                    if market and market.get("active", True) and not market.get("closed", False):
                         logger.info(f"   ✅ Found active market: {test_slug[:50]}...")
                         return market
+            finally:
+                for probe in probes:
+                    probe.cancel()
             
-            # Fallback: Search all markets and filter by pattern
-            logger.info(f"   🔄 Slugs not found, searching all markets by pattern...")
+            # Fallback: Search open markets and filter by pattern
+            logger.info(f"   🔄 Slugs not found, searching open markets by pattern...")
             
+            # Let Gamma drop closed/expired markets and return the soonest-ending first,
+            # which is where the current interval markets sit
             url = f"{GAMMA_API}/markets"
-            params = {"limit": 500}  # Limit to reduce response size
-            response = requests.get(url, params=params, timeout=20)
-            response.raise_for_status()
-            all_markets = response.json()
-            
-            if not isinstance(all_markets, list):
-                all_markets = all_markets.get("data", []) if isinstance(all_markets, dict) else []
-            
-            logger.info(f"   📊 Retrieved {len(all_markets)} markets from Gamma API")
+            params = {
+                "active": "true",
+                "closed": "false",
+                "end_date_min": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(current_timestamp)),
+                "order": "endDate",
+                "ascending": "true",
+                "limit": 100
+            }
             
-            # Filter markets matching the pattern
+            # Filter markets matching the pattern: "<pattern>" or "<pattern>-<timestamp>",
+            # case-insensitive, without lowercasing every slug
+            pattern_re = re.compile(rf"(?:^|[-/]){re.escape(base_pattern)}(?:-\d+|$)", re.IGNORECASE)
             matching_markets = []
-            for market in all_markets:
-                slug = market.get("slug", "")
-                if not slug:
-                    continue
-                
-                slug_lower = slug.lower()
-                pattern_lower = base_pattern.lower()
+            
+            # Stream-parse the response so only matching markets are kept
+            response = self._http.get(url, params=params, timeout=20, stream=True)
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True  # let urllib3 undo gzip/deflate
                 
-                if pattern_lower in slug_lower or slug_lower.startswith(pattern_lower):
+                scanned = 0
+                for market in _iter_list_items(response.raw):
+                    scanned += 1
+                    slug = market.get("slug", "")
+                    if not slug or not pattern_re.search(slug):
+                        continue
+                    
                     is_active = market.get("active", True) and not market.get("closed", False)
                     timestamp = extract_timestamp_from_slug(slug)
                     
@@ -230,6 +487,10 @@ class PolymarketClient:
                         "active": is_active,
                         "closed": market.get("closed", False)
                     })
+            finally:
+                response.close()
+            
+            logger.info(f"   📊 Scanned {scanned} markets from Gamma API")
             
             if not matching_markets:
                 logger.warning(f"   ⚠️  No markets found matching pattern: {base_pattern}")
@@ -254,11 +515,16 @@ class PolymarketClient:
             
         except Exception as e:
             logger.warning(f"   ⚠️  Error searching for market pattern {slug_pattern[:30]}...: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Error details", exc_info=True)
             return None
     
-    def _fetch_market_by_slug_or_condition_id(self, identifier: str) -> Optional[Dict]:
+    def _fetch_market_by_slug_or_condition_id(
+        self,
+        identifier: str,
+        is_slug: Optional[bool] = None,
+        is_15min: Optional[bool] = None,
+        current_timestamp: Optional[int] = None
+    ) -> Optional[Dict]:
         """
         Fetch a market by slug (preferred) or condition_id using Gamma API
         
@@ -269,23 +535,26 @@ class PolymarketClient:
         
         Args:
             identifier: Market slug (e.g., 'btc-updown-15m-1761921000') or condition_id
+            is_slug: Precomputed slug classification (detected if None)
+            is_15min: Precomputed 15-minute market classification (detected if None)
+            current_timestamp: Current 15-minute interval timestamp (computed if None)
         """
         try:
             identifier_clean = identifier.strip()
+            if is_slug is None:
+                is_slug = _looks_like_slug(identifier_clean)
+            if is_15min is None:
+                is_15min = is_15min_interval_market(identifier_clean)
             logger.info(f"   🌐 Fetching market for: {identifier_clean[:50]}...")
             
             # For 15-minute interval markets, use pattern search to find active market
-            if is_15min_interval_market(identifier_clean):
+            if is_15min:
                 logger.info(f"   🔄 Detected 15-min market, searching by slug pattern...")
-                market = self._fetch_active_market_by_pattern(identifier_clean)
+                market = self._fetch_active_market_by_pattern(identifier_clean, current_timestamp)
                 if market:
                     return market
                 logger.warning(f"   ⚠️  Pattern search failed, trying direct slug lookup...")
             
-            # Determine if it's a slug or condition_id
-            # Slugs typically contain hyphens and don't start with 0x
-            is_slug = "-" in identifier_clean and not identifier_clean.startswith("0x")
-            
             market = None
             
             if is_slug:
@@ -301,9 +570,9 @@ class PolymarketClient:
                 url = f"{GAMMA_API}/markets"
                 params = {"condition_ids": identifier_clean}
                 try:
-                    response = requests.get(url, params=params, timeout=10)
+                    response = self._http.get(url, params=params, timeout=10)
                     if response.status_code == 200:
-                        data = response.json()
+                        data = orjson.loads(response.content)
                         if isinstance(data, list) and len(data) > 0:
                             # Filter for active markets
                             active_markets = [m for m in data if m.get("active", True) and not m.get("closed", False)]
@@ -322,14 +591,47 @@ class PolymarketClient:
             if e.response.status_code == 404:
                 logger.warning(f"   ⚠️  Market not found (404): {identifier_clean[:50]}...")
             else:
-                logger.warning(f"   ⚠️  HTTP error: {e.response.status_code} - {e.response.text[:100]}")
+                logger.warning(f"   ⚠️  HTTP error: {e.response.status_code} {e.response.reason}")
             return None
         except Exception as e:
             logger.warning(f"   ⚠️  Error fetching market {identifier_clean[:30]}...: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Error details", exc_info=True)
             return None
     
+    def _fetch_markets_bulk(self, condition_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch several markets by condition_id in a single Gamma API request
+        
+        Args:
+            condition_ids: Condition IDs to look up
+        
+        Returns:
+            Dict of lowercased condition_id -> market data (missing ids are absent)
+        """
+        try:
+            logger.info(f"   🌐 Fetching {len(condition_ids)} markets by condition_id in one request")
+            
+            url = f"{GAMMA_API}/markets"
+            params = [("condition_ids", cid) for cid in condition_ids] + [("limit", len(condition_ids))]
+            response = self._http.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            if not isinstance(data, list):
+                data = data.get("data", []) if isinstance(data, dict) else []
+            
+            markets = {}
+            for market in data:
+                cid = (market.get("conditionId") or market.get("condition_id") or "").lower()
+                # Prefer an active market if the API returns several for one condition_id
+                if cid and (cid not in markets or not markets[cid].get("active", True) or markets[cid].get("closed", False)):
+                    markets[cid] = market
+            return markets
+            
+        except Exception as e:
+            logger.warning(f"   ⚠️  Bulk condition_id lookup failed, falling back to per-market lookups: {e}")
+            return {}
+    
     def get_featured_markets(self, limit: int = 4) -> List[Dict]:
         """
         Get featured markets configured in .env
@@ -346,25 +648,33 @@ class PolymarketClient:
             
             featured = []
             
+            # One interval timestamp for the whole refresh, so every market resolves
+            # against the same 15-minute bucket
+            current_timestamp = get_current_15min_timestamp()
+            
             # If we have featured markets, fetch them directly by slug (preferred) or condition_id
             if self.featured_conditions:
                 logger.info(f"🔍 Fetching {len(self.featured_conditions)} featured markets by slug/condition_id")
                 
-                for condition_id in self.featured_conditions:
-                    cid = condition_id.strip()
-                    
-                    # Check if this is a 15-minute interval market
-                    if is_15min_interval_market(cid):
-                        logger.info(f"🔄 15-min market detected: {cid[:50]}...")
-                        logger.info(f"   Searching for current active market by pattern...")
-                        # Don't update timestamp - let _fetch_market_by_condition_id search for active markets
-                        # It will use pattern matching to find the current active market
-                    else:
-                        logger.info(f"📊 Fetching market: {cid[:50]}...")
-                    
-                    # Try to fetch directly by slug (preferred) or condition_id
-                    market = self._fetch_market_by_slug_or_condition_id(cid)
-                    
+                # Plain condition_ids are resolved together in one batched Gamma request
+                condition_ids = [
+                    cid for cid, is_slug, is_15min in self._featured_parsed
+                    if not is_slug and not is_15min
+                ]
+                bulk = self._fetch_markets_bulk(condition_ids) if condition_ids else {}
+                
+                def fetch(parsed: Tuple[str, bool, bool]) -> Optional[Dict]:
+                    cid, is_slug, is_15min = parsed
+                    market = bulk.get(cid.lower())
+                    if market and market.get("active", True) and not market.get("closed", False):
+                        return market
+                    return self._fetch_market_by_slug_or_condition_id(cid, is_slug, is_15min, current_timestamp)
+                
+                # Fetch the rest concurrently, directly by slug (preferred) or condition_id
+                # 15-minute markets use pattern matching to find the current active market
+                fetched = self._executor.map(fetch, self._featured_parsed)
+                
+                for (cid, _, is_15min), market in zip(self._featured_parsed, fetched):
                     if market:
                         try:
                             # Check if market is active before adding
@@ -373,14 +683,14 @@ class PolymarketClient:
                                 logger.warning(f"⚠️  Market is CLOSED: {market.get('question', 'Unknown')[:50]}...")
                                 logger.warning(f"   Skipping closed market. Active: {market.get('active')}, Closed: {market.get('closed')}")
                                 # For 15-minute markets, continue searching for active one
-                                if is_15min_interval_market(condition_id):
+                                if is_15min:
                                     logger.info(f"   🔄 Continuing search for active 15-minute market...")
                                     continue
                             
                             formatted = self._format_market(market)
                             # Store the original condition_id pattern for reference
-                            if is_15min_interval_market(condition_id):
-                                formatted["_original_pattern"] = condition_id
+                            if is_15min:
+                                formatted["_original_pattern"] = cid
                                 formatted["_is_15min_interval"] = True
                             
                             # Verify it's active before adding
@@ -393,8 +703,7 @@ class PolymarketClient:
                                 logger.warning(f"⚠️  Market marked as inactive/closed, skipping")
                         except Exception as e:
                             logger.warning(f"❌ Error formatting market {cid[:30]}...: {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
+                            logger.debug("Error details", exc_info=True)
                     else:
                         logger.warning(f"❌ Market not found: {cid[:50]}...")
                 
@@ -429,8 +738,7 @@ class PolymarketClient:
             
         except Exception as e:
             logger.error(f"Error fetching markets: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.debug("Error details", exc_info=True)
             return []
     
     def _format_market(self, market: Dict) -> Dict:
@@ -438,13 +746,21 @@ class PolymarketClient:
         
         Handles both Gamma API and CLOB API formats
         """
-        condition_id = market.get("condition_id", "")
+        # Read each field once up front
+        q = market.get
+        condition_id = q("condition_id", "")
+        clob_token_ids = q("clobTokenIds", "")
+        outcomes = q("outcomes", "")
+        short_outcomes = q("shortOutcomes", "")
+        outcome_prices = q("outcomePrices", "")
+        raw_tokens = q("tokens")
+        slug = q("slug")
+        event_slug = q("eventSlug")
         
         # Extract tokens - handle different API formats
         tokens = []
         
         # Method 1: Gamma API format - has clobTokenIds as comma-separated string
-        clob_token_ids = market.get("clobTokenIds", "")
         if clob_token_ids:
             if isinstance(clob_token_ids, str):
                 # Parse comma-separated string
@@ -454,18 +770,13 @@ class PolymarketClient:
             else:
                 token_ids = []
             
-            # Get outcomes from market data
-            outcomes = market.get("outcomes", "")
-            short_outcomes = market.get("shortOutcomes", "")
-            
             # Parse outcomes
             outcome_list = []
             if outcomes:
                 if isinstance(outcomes, str):
                     # Could be comma-separated or JSON string
                     try:
-                        import json
-                        outcome_list = json.loads(outcomes)
+                        outcome_list = orjson.loads(outcomes)
                     except:
                         outcome_list = [outcome.strip() for outcome in outcomes.split(",")]
                 elif isinstance(outcomes, list):
@@ -475,8 +786,7 @@ class PolymarketClient:
             if not outcome_list and short_outcomes:
                 if isinstance(short_outcomes, str):
                     try:
-                        import json
-                        outcome_list = json.loads(short_outcomes)
+                        outcome_list = orjson.loads(short_outcomes)
                     except:
                         outcome_list = [outcome.strip() for outcome in short_outcomes.split(",")]
                 elif isinstance(short_outcomes, list):
@@ -486,16 +796,21 @@ class PolymarketClient:
             if not outcome_list:
                 outcome_list = ["Yes", "No"]
             
+            # Parse outcomePrices once rather than per token
+            prices = None
+            if outcome_prices:
+                try:
+                    prices = orjson.loads(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
+                except:
+                    pass
+            
             # Create tokens from token IDs and outcomes
             for i, token_id in enumerate(token_ids):
                 outcome = outcome_list[i] if i < len(outcome_list) else f"Outcome {i+1}"
                 # Get price from outcomePrices if available
-                outcome_prices = market.get("outcomePrices", "")
                 price = 0.5  # Default
-                if outcome_prices:
+                if prices:
                     try:
-                        import json
-                        prices = json.loads(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
                         if isinstance(prices, list) and i < len(prices):
                             price = float(prices[i])
                         elif isinstance(prices, dict) and outcome in prices:
@@ -511,8 +826,8 @@ class PolymarketClient:
                 })
         
         # Method 2: CLOB API format - has tokens array
-        elif market.get("tokens"):
-            for token in market.get("tokens", []):
+        elif raw_tokens:
+            for token in raw_tokens:
                 if isinstance(token, dict):
                     tokens.append({
                         "token_id": token.get("token_id", ""),
@@ -536,15 +851,15 @@ class PolymarketClient:
         
         formatted = {
             "condition_id": condition_id,
-            "question": market.get("question", "Unknown Market"),
-            "description": market.get("description", ""),
+            "question": q("question", "Unknown Market"),
+            "description": q("description", ""),
             "tokens": tokens,
-            "active": market.get("active", True),
-            "closed": market.get("closed", False),
-            "end_date": market.get("end_date_iso", "") or market.get("endDate", ""),
+            "active": q("active", True),
+            "closed": q("closed", False),
+            "end_date": q("end_date_iso", "") or q("endDate", ""),
             # Preserve slug information for 15-minute markets
-            "slug": market.get("slug") or market.get("eventSlug", ""),
-            "eventSlug": market.get("eventSlug") or market.get("slug", "")
+            "slug": slug or event_slug or "",
+            "eventSlug": event_slug or slug or ""
         }
         
         return formatted
@@ -578,53 +893,107 @@ class PolymarketClient:
         Returns:
             Market details including orderbook and prices
         """
-        try:
-            logger.info(f"Fetching details for token: {token_id}")
-            
-            # Get order book
-            order_book = self.read_client.get_order_book(token_id)
-            
-            # Get current price and midpoint
-            buy_price = self.read_client.get_price(token_id, side="BUY")
-            sell_price = self.read_client.get_price(token_id, side="SELL")
-            midpoint = self.read_client.get_midpoint(token_id)
-            
-            # Get last trade price
-            try:
-                last_trade = self.read_client.get_last_trade_price(token_id)
-            except:
-                last_trade = midpoint
-            
-            details = {
-                "token_id": token_id,
-                "buy_price": float(buy_price) if buy_price else 0.5,
-                "sell_price": float(sell_price) if sell_price else 0.5,
-                "midpoint": float(midpoint) if midpoint else 0.5,
-                "last_trade": float(last_trade) if last_trade else 0.5,
-                "order_book": {
-                    "market": order_book.market if order_book else token_id,
-                    "bids": len(order_book.bids) if order_book else 0,
-                    "asks": len(order_book.asks) if order_book else 0
-                }
-            }
-            
-            logger.info(f"✅ Retrieved market details")
-            logger.info(f"   Midpoint: ${details['midpoint']:.4f}")
-            logger.info(f"   Buy: ${details['buy_price']:.4f}, Sell: ${details['sell_price']:.4f}")
-            
-            return details
+        # Batched endpoints issued in parallel: 4 concurrent requests instead of 5 serial ones
+        details = self.get_market_details_bulk([token_id])[token_id]
+        if isinstance(details, Exception):
+            raise details
+        return details
+    
+    def get_market_details_bulk(self, token_ids: List[str]) -> Dict[str, Union[Dict, Exception]]:
+        """
+        Get detailed information for several tokens using the batched CLOB endpoints
+        
+        Issues one request each for order books, prices, midpoints and last trades
+        (in parallel) regardless of how many tokens are requested. If the batch is
+        rejected (e.g. one unknown token ID), it is split in half and retried so a
+        bad token only fails its own lookup.
+        
+        Args:
+            token_ids: Token IDs to get details for
             
+        Returns:
+            Dict of token_id -> market details (same shape as get_market_details),
+            or the exception raised while fetching that token
+        """
+        try:
+            return self._fetch_market_details_bulk(token_ids)
         except Exception as e:
-            logger.error(f"Error fetching market details: {str(e)}")
-            # Return default data
-            return {
-                "token_id": token_id,
-                "buy_price": 0.5,
-                "sell_price": 0.5,
-                "midpoint": 0.5,
-                "last_trade": 0.5,
-                "order_book": {"market": token_id, "bids": 0, "asks": 0}
+            if len(token_ids) == 1:
+                logger.error("Error fetching market details for %s: %s", token_ids[0], e)
+                return {token_ids[0]: e}
+            
+            logger.warning("Bulk market details failed for %d tokens, splitting batch: %s", len(token_ids), e)
+            mid = len(token_ids) // 2
+            results = self.get_market_details_bulk(token_ids[:mid])
+            results.update(self.get_market_details_bulk(token_ids[mid:]))
+            return results
+    
+    def _fetch_market_details_bulk(self, token_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch market details for token_ids in one round of batched calls; raises on failure"""
+        logger.info(f"Fetching details for {len(token_ids)} tokens")
+        
+        book_params = [BookParams(token_id=token_id) for token_id in token_ids]
+        price_params = [
+            BookParams(token_id=token_id, side=side)
+            for token_id in token_ids
+            for side in ("BUY", "SELL")
+        ]
+        
+        # The four batched lookups are independent, so run them concurrently
+        books_future = self._clob_executor.submit(self.read_client.get_order_books, book_params)
+        prices_future = self._clob_executor.submit(self.read_client.get_prices, price_params)
+        midpoints_future = self._clob_executor.submit(self.read_client.get_midpoints, book_params)
+        last_trades_future = self._clob_executor.submit(self.read_client.get_last_trades_prices, book_params)
+        
+        order_books = books_future.result() or []
+        prices = prices_future.result() or {}
+        midpoints = midpoints_future.result() or {}
+        
+        # Last trade is optional; fall back to the midpoint if it can't be fetched
+        try:
+            last_trades = {
+                t.get("token_id"): t.get("price")
+                for t in last_trades_future.result() or []
             }
+        except Exception as e:
+            logger.warning("Error fetching last trade prices: %s", e)
+            last_trades = {}
+        
+        books_by_token = {book.asset_id: book for book in order_books}
+        
+        results = {}
+        for token_id in token_ids:
+            details = self._default_market_details(token_id)
+            token_prices = prices.get(token_id) or {}
+            midpoint = midpoints.get(token_id)
+            last_trade = last_trades.get(token_id) or midpoint
+            book = books_by_token.get(token_id)
+            
+            details["buy_price"] = float(token_prices.get("BUY") or 0.5)
+            details["sell_price"] = float(token_prices.get("SELL") or 0.5)
+            details["midpoint"] = float(midpoint) if midpoint else 0.5
+            details["last_trade"] = float(last_trade) if last_trade else 0.5
+            if book:
+                details["order_book"] = {
+                    "market": book.market,
+                    "bids": len(book.bids or []),
+                    "asks": len(book.asks or [])
+                }
+            results[token_id] = details
+        
+        logger.info(f"✅ Retrieved market details for {len(token_ids)} tokens")
+        return results
+    
+    def _default_market_details(self, token_id: str) -> Dict:
+        """Default market details used when CLOB data is unavailable"""
+        return {
+            "token_id": token_id,
+            "buy_price": 0.5,
+            "sell_price": 0.5,
+            "midpoint": 0.5,
+            "last_trade": 0.5,
+            "order_book": {"market": token_id, "bids": 0, "asks": 0}
+        }
     
     def place_limit_order(
         self,
@@ -648,13 +1017,13 @@ class PolymarketClient:
         if not self.trade_client:
             raise Exception("Trading client not initialized. Check credentials.")
         
+        # Reject locally what the CLOB would reject anyway, saving the round-trip
+        error = self._validate_limit_order({"token_id": token_id, "side": side, "price": price, "size": size})
+        if error:
+            logger.debug("Limit order rejected locally: %s", error)
+            raise ValueError(error)
+        
         try:
-            logger.info(f"Creating limit order")
-            logger.info(f"   Token: {token_id}")
-            logger.info(f"   Side: {side}")
-            logger.info(f"   Price: ${price}")
-            logger.info(f"   Size: {size} USDC")
-            
             # Convert side to constant
             order_side = BUY if side.upper() == "BUY" else SELL
             
@@ -671,14 +1040,17 @@ class PolymarketClient:
             
             # Post to CLOB
             response = self.trade_client.post_order(signed_order, OrderType.GTC)
+            self._invalidate_account_cache()
             
-            logger.info(f"✅ Order placed successfully")
-            logger.info(f"   Order ID: {response.get('orderID', 'N/A')}")
+            logger.info(
+                "Limit order placed token=%s side=%s price=%s size=%s id=%s",
+                token_id, side, price, size, response.get('orderID', 'N/A')
+            )
             
             return response
             
         except Exception as e:
-            logger.error(f"Error placing order: {str(e)}")
+            logger.error("Error placing order: %s", e)
             raise
     
     def place_market_order(
@@ -701,9 +1073,14 @@ class PolymarketClient:
         if not self.trade_client:
             raise Exception("Trading client not initialized. Check credentials.")
         
+        if side.upper() not in ("BUY", "SELL"):
+            logger.debug("Market order rejected locally: invalid side %s", side)
+            raise ValueError(f"Invalid side: {side}")
+        if amount <= 0:
+            logger.debug("Market order rejected locally: amount %s", amount)
+            raise ValueError(f"Amount must be positive, got {amount}")
+        
         try:
-            logger.info(f"Creating market order for {amount} USDC")
-            
             # Convert side to constant
             order_side = BUY if side.upper() == "BUY" else SELL
             
@@ -718,15 +1095,207 @@ class PolymarketClient:
             # Sign and post
             signed_order = self.trade_client.create_market_order(order)
             response = self.trade_client.post_order(signed_order, OrderType.FOK)
+            self._invalidate_account_cache()
             
-            logger.info(f"✅ Market order executed")
+            logger.info(
+                "Market order executed token=%s side=%s amount=%s id=%s",
+                token_id, side, amount, response.get('orderID', 'N/A')
+            )
             
             return response
             
         except Exception as e:
-            logger.error(f"Error placing market order: {str(e)}")
+            logger.error("Error placing market order: %s", e)
             raise
     
+    def place_orders_batch(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Place several limit orders (GTC) with as few CLOB requests as possible
+        
+        Orders are validated and signed locally, then posted in batches of
+        MAX_BATCH_ORDERS. Invalid orders are rejected up front and never sent.
+        
+        Args:
+            orders: List of {"token_id", "side", "price", "size"} dicts,
+                    same fields as place_limit_order
+            
+        Returns:
+            One response per input order, in input order. Each has "success"
+            and, on failure, "errorMsg" so callers can retry only rejected items
+        """
+        if not self.trade_client:
+            raise Exception("Trading client not initialized. Check credentials.")
+        
+        results: List[Optional[Dict]] = [None] * len(orders)
+        
+        # Client-side validation: anything the CLOB would reject anyway is dropped here
+        constraints = self._prefetch_order_constraints(
+            [order["token_id"] for order in orders if isinstance(order, dict) and "token_id" in order]
+        )
+        valid = []
+        for index, order in enumerate(orders):
+            error = self._validate_limit_order(order, constraints)
+            if error:
+                results[index] = {"success": False, "errorMsg": error}
+            else:
+                valid.append(index)
+        
+        logger.info("Creating batch of %s limit orders (%s rejected locally)", len(valid), len(orders) - len(valid))
+        
+        def sign(index: int):
+            order = orders[index]
+            return self.trade_client.create_order(OrderArgs(
+                token_id=order["token_id"],
+                price=float(order["price"]),
+                size=float(order["size"]),
+                side=BUY if order["side"].upper() == "BUY" else SELL
+            ))
+        
+        # Signing also looks up tick size / neg-risk per token, so fan it out
+        signed = {}
+        futures = {index: self._sign_executor.submit(sign, index) for index in valid}
+        for index, future in futures.items():
+            try:
+                signed[index] = future.result()
+            except Exception as e:
+                results[index] = {"success": False, "errorMsg": f"Signing failed: {e}"}
+        
+        pending = [index for index in valid if index in signed]
+        for start in range(0, len(pending), MAX_BATCH_ORDERS):
+            chunk = pending[start:start + MAX_BATCH_ORDERS]
+            try:
+                responses = self.trade_client.post_orders([
+                    PostOrdersArgs(order=signed[index], orderType=OrderType.GTC)
+                    for index in chunk
+                ]) or []
+            except Exception as e:
+                logger.error("Error posting order batch: %s", e)
+                responses = []
+                for index in chunk:
+                    results[index] = {"success": False, "errorMsg": str(e)}
+                continue
+            
+            # The CLOB answers with one entry per posted order, in the same order
+            for index, response in zip(chunk, responses):
+                results[index] = response
+            for index in chunk[len(responses):]:
+                results[index] = {"success": False, "errorMsg": "No response for order"}
+        
+        self._invalidate_account_cache()
+        placed = sum(1 for r in results if r and r.get("success"))
+        logger.info("✅ Batch placed: %s/%s orders accepted", placed, len(orders))
+        
+        return results
+    
+    def _get_order_constraints(self, token_id: str) -> Tuple[float, float]:
+        """Tick size and minimum order size for a token (from its order book, cached)"""
+        with self._cache_lock:
+            cached = self._order_constraints.get(token_id)
+        if cached:
+            return cached
+        
+        book = self.read_client.get_order_book(token_id)
+        constraints = (
+            float(getattr(book, "tick_size", None) or self.read_client.get_tick_size(token_id)),
+            float(getattr(book, "min_order_size", None) or 0)
+        )
+        
+        with self._cache_lock:
+            self._order_constraints[token_id] = constraints
+        return constraints
+    
+    def _prefetch_order_constraints(self, token_ids: List[str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Tick size and minimum order size for several tokens with one order-book request
+        
+        Tokens whose constraints can't be fetched are left out of the result, so
+        validation skips those checks for them rather than rejecting the order.
+        """
+        constraints = {}
+        missing = []
+        with self._cache_lock:
+            for token_id in dict.fromkeys(token_ids):
+                cached = self._order_constraints.get(token_id)
+                if cached:
+                    constraints[token_id] = cached
+                else:
+                    missing.append(token_id)
+        
+        if not missing:
+            return constraints
+        
+        try:
+            books = self.read_client.get_order_books([BookParams(token_id=token_id) for token_id in missing]) or []
+        except Exception as e:
+            logger.warning("Unable to prefetch order constraints for %s tokens: %s", len(missing), e)
+            return constraints
+        
+        fetched = {}
+        for book in books:
+            tick = getattr(book, "tick_size", None)
+            if book.asset_id in missing and tick:
+                fetched[book.asset_id] = (float(tick), float(getattr(book, "min_order_size", None) or 0))
+        
+        with self._cache_lock:
+            self._order_constraints.update(fetched)
+        constraints.update(fetched)
+        return constraints
+    
+    def _validate_limit_order(
+        self,
+        order: Dict,
+        constraints: Optional[Dict[str, Tuple[float, float]]] = None
+    ) -> Optional[str]:
+        """
+        Return why a limit order would be rejected, or None if it looks valid
+        
+        Args:
+            order: {"token_id", "side", "price", "size"}
+            constraints: Prefetched token_id -> (tick size, min size); when given,
+                         no per-token lookup is made
+        """
+        try:
+            side = order["side"].upper()
+            price = float(order["price"])
+            size = float(order["size"])
+            token_id = order["token_id"]
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            return f"Malformed order: {e}"
+        
+        if side not in ("BUY", "SELL"):
+            return f"Invalid side: {order['side']}"
+        if not 0 < price < 1:
+            return f"Price {price} outside (0, 1)"
+        if size <= 0:
+            return f"Size must be positive, got {size}"
+        
+        # Fail open: if constraints are unavailable, let the CLOB make the call
+        if constraints is not None:
+            token_constraints = constraints.get(token_id)
+        else:
+            try:
+                token_constraints = self._get_order_constraints(token_id)
+            except Exception as e:
+                logger.warning("Unable to fetch order constraints for %s: %s", token_id, e)
+                token_constraints = None
+        if token_constraints is None:
+            return None
+        tick, min_size = token_constraints
+        
+        # Compare in integer ticks-of-1e-4 (the finest CLOB tick) to dodge float error
+        price_units = price * 10_000
+        if abs(price_units - round(price_units)) > 1e-6 or round(price_units) % round(tick * 10_000):
+            return f"Price {price} is not a multiple of tick size {tick}"
+        if size < min_size:
+            return f"Size {size} below minimum order size {min_size}"
+        
+        return None
+    
+    def _invalidate_account_cache(self) -> None:
+        """Drop cached open orders / trades after placing or cancelling orders"""
+        with self._cache_lock:
+            self._account_cache.clear()
+    
     def get_open_orders(self) -> List[Dict]:
         """
         Get all open orders for the authenticated user
@@ -737,17 +1306,25 @@ class PolymarketClient:
         if not self.trade_client:
             raise Exception("Trading client not initialized. Check credentials.")
         
+        # Repeated UI polls within ACCOUNT_CACHE_TTL share one fetch
+        with self._cache_lock:
+            cached = self._account_cache.get("orders")
+        if cached is not None:
+            return cached
+        
         try:
             logger.info("Fetching open orders")
             
             orders = self.trade_client.get_orders(OpenOrderParams())
             
-            logger.info(f"✅ Retrieved {len(orders)} open orders")
+            logger.info("✅ Retrieved %s open orders", len(orders))
             
+            with self._cache_lock:
+                self._account_cache["orders"] = orders
             return orders
             
         except Exception as e:
-            logger.error(f"Error fetching orders: {str(e)}")
+            logger.error("Error fetching orders: %s", e)
             return []
     
     def cancel_order(self, order_id: str) -> Dict:
@@ -764,18 +1341,155 @@ class PolymarketClient:
             raise Exception("Trading client not initialized. Check credentials.")
         
         try:
-            logger.info(f"Cancelling order: {order_id}")
+            logger.info("Cancelling order: %s", order_id)
             
             response = self.trade_client.cancel(order_id)
+            self._invalidate_account_cache()
             
-            logger.info(f"✅ Order cancelled: {order_id}")
+            logger.info("✅ Order cancelled: %s", order_id)
             
             return response
             
         except Exception as e:
-            logger.error(f"Error cancelling order: {str(e)}")
+            logger.error("Error cancelling order: %s", e)
+            raise
+    
+    def cancel_orders_batch(self, order_ids: List[str]) -> List[Dict]:
+        """
+        Cancel several orders in a single CLOB request
+        
+        Args:
+            order_ids: Order IDs to cancel
+            
+        Returns:
+            One {"orderID", "success", "errorMsg"} entry per input ID, in input order
+        """
+        if not self.trade_client:
+            raise Exception("Trading client not initialized. Check credentials.")
+        
+        if not order_ids:
+            return []
+        
+        try:
+            logger.info("Cancelling %s orders", len(order_ids))
+            
+            response = self.trade_client.cancel_orders(list(order_ids)) or {}
+            self._invalidate_account_cache()
+            
+            canceled = set(response.get("canceled") or [])
+            not_canceled = response.get("not_canceled") or {}
+            
+            results = [
+                {
+                    "orderID": order_id,
+                    "success": order_id in canceled,
+                    "errorMsg": "" if order_id in canceled else not_canceled.get(order_id, "Not cancelled")
+                }
+                for order_id in order_ids
+            ]
+            
+            logger.info("✅ Cancelled %s/%s orders", len(canceled), len(order_ids))
+            
+            return results
+            
+        except Exception as e:
+            logger.error("Error cancelling orders: %s", e)
             raise
     
+    def amend_order(
+        self,
+        order_id: str,
+        new_price: Optional[float] = None,
+        new_size: Optional[float] = None
+    ) -> Dict:
+        """
+        Re-price and/or re-size an open limit order
+        
+        The CLOB has no modify endpoint, so this is cancel-then-new: the
+        replacement is validated before anything is cancelled, and it always
+        joins the back of the queue (even on a size-down)
+        
+        Args:
+            order_id: Open order to amend
+            new_price: New limit price (defaults to the current price)
+            new_size: New size (defaults to the unfilled remainder)
+            
+        Returns:
+            Order response for the replacement order
+        """
+        result = self.batch_amend([{"order_id": order_id, "price": new_price, "size": new_size}])[0]
+        if not result.get("success"):
+            raise Exception(result.get("errorMsg") or f"Failed to amend order {order_id}")
+        return result
+    
+    def batch_amend(self, amends: List[Dict]) -> List[Dict]:
+        """
+        Amend several open orders with one batch cancel and one batch placement
+        
+        Args:
+            amends: List of {"order_id", "price", "size"} dicts; a missing or
+                    None price/size keeps the order's current value
+            
+        Returns:
+            One response per amend, in input order (replacement order response,
+            or {"success": False, "errorMsg"} if the amend didn't go through)
+        """
+        if not self.trade_client:
+            raise Exception("Trading client not initialized. Check credentials.")
+        
+        results: List[Optional[Dict]] = [None] * len(amends)
+        
+        # Look up the orders being amended to fill in token, side and defaults
+        futures = [
+            self._sign_executor.submit(self.trade_client.get_order, amend["order_id"])
+            for amend in amends
+        ]
+        replacements = {}
+        for index, (amend, future) in enumerate(zip(amends, futures)):
+            try:
+                existing = future.result()
+                remaining = float(existing["original_size"]) - float(existing.get("size_matched") or 0)
+                price = amend.get("price")
+                size = amend.get("size")
+                replacements[index] = {
+                    "token_id": existing["asset_id"],
+                    "side": existing["side"],
+                    "price": float(existing["price"]) if price is None else price,
+                    "size": remaining if size is None else size
+                }
+            except Exception as e:
+                results[index] = {"success": False, "errorMsg": f"Unable to load order: {e}"}
+        
+        # Reject bad replacements before cancelling anything
+        constraints = self._prefetch_order_constraints(
+            [replacement["token_id"] for replacement in replacements.values()]
+        )
+        for index, replacement in list(replacements.items()):
+            error = self._validate_limit_order(replacement, constraints)
+            if error:
+                results[index] = {"success": False, "errorMsg": error}
+                del replacements[index]
+        
+        if replacements:
+            logger.info("Amending %s orders", len(replacements))
+            
+            indices = list(replacements)
+            cancelled = self.cancel_orders_batch([amends[index]["order_id"] for index in indices])
+            
+            # Only replace orders that were actually cancelled (not filled in the meantime)
+            to_place = []
+            for index, cancel in zip(indices, cancelled):
+                if cancel["success"]:
+                    to_place.append(index)
+                else:
+                    results[index] = {"success": False, "errorMsg": f"Cancel failed: {cancel['errorMsg']}"}
+            
+            placed = self.place_orders_batch([replacements[index] for index in to_place])
+            for index, response in zip(to_place, placed):
+                results[index] = response
+        
+        return results
+    
     def cancel_all_orders(self) -> Dict:
         """
         Cancel all open orders
@@ -790,13 +1504,14 @@ class PolymarketClient:
             logger.info("Cancelling all orders")
             
             response = self.trade_client.cancel_all()
+            self._invalidate_account_cache()
             
-            logger.info(f"✅ All orders cancelled")
+            logger.info("✅ All orders cancelled")
             
             return response
             
         except Exception as e:
-            logger.error(f"Error cancelling all orders: {str(e)}")
+            logger.error("Error cancelling all orders: %s", e)
             raise
     
     def get_trades(self, limit: int = 10) -> List[Dict]:
@@ -809,13 +1524,146 @@ class PolymarketClient:
         Returns:
             List of recent trades
         """
+        with self._cache_lock:
+            cached = self._account_cache.get("trades")
+        if cached is not None:
+            return cached[:limit]
+        
         try:
-            logger.info(f"Fetching last {limit} trades")
+            logger.info("Fetching last %s trades", limit)
             
             trades = self.trade_client.get_trades() if self.trade_client else []
             
+            with self._cache_lock:
+                self._account_cache["trades"] = trades
             return trades[:limit]
             
         except Exception as e:
-            logger.error(f"Error fetching trades: {str(e)}")
-            return []
\ No newline at end of file
+            logger.error("Error fetching trades: %s", e)
+            return []
+
+
+class OrderBatcher:
+    """
+    Coalesces limit orders submitted within a short window into batch POSTs
+    
+    Callers await submit() as if placing a single order; orders arriving within
+    `interval` seconds of the first one in a window (up to max_batch_size) are
+    signed and posted together via PolymarketClient.place_orders_batch.
+    Market (FOK) orders should keep using place_market_order directly.
+    
+    `run` is the coroutine used to execute the blocking batch POST (called as
+    run(fn, *args)); pass the app's bounded runner so batches share its
+    concurrency limit. Defaults to the loop's default executor.
+    """
+    
+    def __init__(
+        self,
+        client: PolymarketClient,
+        interval: float = 0.1,
+        max_batch_size: int = MAX_BATCH_ORDERS,
+        run: Optional[Callable[..., Awaitable]] = None
+    ):
+        self._client = client
+        self._run_blocking = run or self._run_in_default_executor
+        self.interval = interval
+        self.max_batch_size = min(max_batch_size, MAX_BATCH_ORDERS)
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight = set()
+        # Window currently being filled by _run, kept here so stop() can flush it
+        self._batch: List[Tuple[Dict, asyncio.Future]] = []
+    
+    def start(self) -> None:
+        """Start the background worker (must be called from a running event loop)"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop collecting, flush whatever is queued and wait for in-flight batches"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        
+        leftover = self._batch
+        self._batch = []
+        while not self._queue.empty():
+            leftover.append(self._queue.get_nowait())
+        for start in range(0, len(leftover), self.max_batch_size):
+            self._dispatch(leftover[start:start + self.max_batch_size])
+        
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+    
+    async def submit(self, order: Dict) -> Dict:
+        """
+        Queue a limit order for the next batch and wait for its CLOB response
+        
+        Args:
+            order: {"token_id", "side", "price", "size"}, as for place_limit_order
+            
+        Returns:
+            Order response from CLOB
+            
+        Raises:
+            Exception: if the order was rejected (locally or by the CLOB)
+        """
+        if self._worker is None:
+            raise Exception("Order batcher not started")
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((order, fut))
+        return await fut
+    
+    async def _run(self) -> None:
+        """Collect orders into windows and hand each full window off for posting"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch = batch = [await self._queue.get()]
+            deadline = loop.time() + self.interval
+            
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Post in the background so the next window starts collecting immediately
+            self._batch = []
+            self._dispatch(batch)
+    
+    def _dispatch(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        task = asyncio.create_task(self._post(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+    
+    @staticmethod
+    async def _run_in_default_executor(fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+    
+    async def _post(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        orders = [order for order, _ in batch]
+        try:
+            results = await self._run_blocking(self._client.place_orders_batch, orders)
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        
+        for (_, fut), result in zip(batch, results):
+            if fut.done():
+                continue
+            if result and result.get("success", True) and not result.get("errorMsg"):
+                fut.set_result(result)
+            else:
+                fut.set_exception(Exception((result or {}).get("errorMsg") or "Order rejected"))
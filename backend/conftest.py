@@ -0,0 +1 @@
+# Makes the backend modules (app, clob_client, wallet_utils, utils) importable from tests/
@@ -0,0 +1,70 @@
+"""
+Tests for WalletManager transaction hash handling
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("web3")
+from hexbytes import HexBytes
+
+import wallet_utils
+from wallet_utils import WalletManager
+
+
+def _make_manager(rpc_calls):
+    """WalletManager wired to fakes instead of a live RPC"""
+    manager = WalletManager.__new__(WalletManager)
+    manager.http = None
+    manager.chain_id = 137
+    manager.deployer_key = "key"
+    manager.deployer_account = SimpleNamespace(address="0x" + "22" * 20)
+    manager.safe_factory = SimpleNamespace(address=wallet_utils.SAFE_FACTORY_ADDRESS)
+    manager._receipt_waiters = {}
+    manager._receipt_poller = None
+    
+    manager._next_nonce = AsyncMock(return_value=7)
+    manager._get_fees = AsyncMock(return_value=(2, 1))
+    manager._encode_setup = lambda owner: b"setup"
+    manager._encode_create_proxy = lambda setup_data, salt_nonce: b"call"
+    manager.predict_safe_address = lambda owner, salt_nonce, setup_data=None: "0x" + "33" * 20
+    
+    manager.w3 = SimpleNamespace(eth=SimpleNamespace(account=SimpleNamespace(
+        sign_transaction=lambda tx, key: SimpleNamespace(raw_transaction=b"raw")
+    )))
+    manager.async_w3 = SimpleNamespace(eth=SimpleNamespace(
+        send_raw_transaction=AsyncMock(return_value=HexBytes(b"\x12" * 32)),
+        get_transaction_receipt=AsyncMock(return_value={"status": 1, "gasUsed": 1})
+    ))
+    
+    async def rpc_batch(calls):
+        rpc_calls.extend(calls)
+        return [{"status": "0x1"} for _ in calls]
+    
+    manager._rpc_batch = rpc_batch
+    return manager
+
+
+def test_receipt_polling_uses_0x_prefixed_hashes(monkeypatch):
+    monkeypatch.setattr(wallet_utils, "RECEIPT_POLL_INTERVAL", 0)
+    rpc_calls = []
+    manager = _make_manager(rpc_calls)
+    
+    asyncio.run(manager.create_safe_proxies_bulk(["0x" + "11" * 20]))
+    
+    assert rpc_calls
+    for method, params in rpc_calls:
+        assert method == "eth_getTransactionReceipt"
+        assert params == ["0x" + "12" * 32]
+
+
+def test_receipts_come_from_the_batch_result(monkeypatch):
+    monkeypatch.setattr(wallet_utils, "RECEIPT_POLL_INTERVAL", 0)
+    manager = _make_manager([])
+    
+    receipts = asyncio.run(manager.wait_many(["0x" + "12" * 32]))
+    
+    assert receipts["0x" + "12" * 32]["status"] == 1
+    manager.async_w3.eth.get_transaction_receipt.assert_not_called()
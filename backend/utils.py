@@ -1,10 +1,17 @@
 """
 Utility functions for timestamp calculations and market slug handling
 """
-import math
-from datetime import datetime, timezone
+import re
+import time
+from functools import lru_cache
 from typing import Optional
 
+INTERVAL_SECONDS = 900  # 15 minutes
+
+# Trailing numeric segment of a slug, e.g. the timestamp in "btc-updown-15m-1761921000"
+_SLUG_TIMESTAMP_RE = re.compile(r'(?:^|-)(\d+)$')
+_15MIN_MARKET_RE = re.compile(r'-15m-|^(?:btc|eth)-updown-15m', re.IGNORECASE)
+
 
 def get_current_15min_timestamp() -> int:
     """
@@ -13,11 +20,9 @@ def get_current_15min_timestamp() -> int:
     Returns the start timestamp of the current 15-minute interval
     Example: If it's 10:17, returns the timestamp for 10:15
     """
-    now = datetime.now(timezone.utc)
-    # Round down to the nearest 15 minutes
-    minutes = (now.minute // 15) * 15
-    rounded = now.replace(minute=minutes, second=0, microsecond=0)
-    return int(rounded.timestamp())
+    # Plain integer math: no datetime objects on this hot path
+    now = int(time.time())
+    return now - now % INTERVAL_SECONDS
 
 
 def get_next_15min_timestamp() -> int:
@@ -26,12 +31,10 @@ def get_next_15min_timestamp() -> int:
     
     Returns the timestamp for the next 15-minute interval
     """
-    now = datetime.now(timezone.utc)
-    current_15min = get_current_15min_timestamp()
-    # Add 15 minutes (900 seconds)
-    return current_15min + 900
+    return get_current_15min_timestamp() + INTERVAL_SECONDS
 
 
+@lru_cache(maxsize=8192)
 def extract_timestamp_from_slug(slug: str) -> Optional[int]:
     """
     Extract timestamp from event slug
@@ -39,16 +42,15 @@ def extract_timestamp_from_slug(slug: str) -> Optional[int]:
     - "btc-updown-15m-1761921000" -> 1761921000
     - "eth-updown-15m-1761921000" -> 1761921000
     """
-    try:
-        # Try to find timestamp at the end (last segment after last dash)
-        parts = slug.split("-")
-        if parts:
-            timestamp_str = parts[-1]
-            if timestamp_str.isdigit():
-                return int(timestamp_str)
-    except:
-        pass
-    return None
+    match = _SLUG_TIMESTAMP_RE.search(slug)
+    return int(match.group(1)) if match else None
+
+
+@lru_cache(maxsize=8192)
+def _strip_slug_timestamp(slug: str) -> str:
+    """Drop a trailing "-<digits>" segment, if any"""
+    match = _SLUG_TIMESTAMP_RE.search(slug)
+    return slug[:match.start()] if match and match.start(1) > 0 else slug
 
 
 def update_slug_with_current_timestamp(base_slug: str) -> str:
@@ -63,17 +65,7 @@ def update_slug_with_current_timestamp(base_slug: str) -> str:
     Example:
         "btc-updown-15m-1761921000" -> "btc-updown-15m-1761921600" (if time moved to next interval)
     """
-    # Remove old timestamp if present
-    parts = base_slug.split("-")
-    # Keep everything except the last part (if it's a timestamp)
-    if len(parts) > 1 and parts[-1].isdigit():
-        base_parts = parts[:-1]
-    else:
-        base_parts = parts
-    
-    # Add current timestamp
-    current_timestamp = get_current_15min_timestamp()
-    return "-".join(base_parts) + "-" + str(current_timestamp)
+    return f"{_strip_slug_timestamp(base_slug)}-{get_current_15min_timestamp()}"
 
 
 def is_15min_interval_market(condition_id_or_slug: str) -> bool:
@@ -84,12 +76,7 @@ def is_15min_interval_market(condition_id_or_slug: str) -> bool:
     - btc-updown-15m-*
     - eth-updown-15m-*
     """
-    slug_lower = condition_id_or_slug.lower()
-    return (
-        "-15m-" in slug_lower or 
-        slug_lower.startswith("btc-updown-15m") or
-        slug_lower.startswith("eth-updown-15m")
-    )
+    return _15MIN_MARKET_RE.search(condition_id_or_slug) is not None
 
 
 def get_seconds_until_next_15min() -> int:
@@ -98,14 +85,4 @@ def get_seconds_until_next_15min() -> int:
     
     Useful for scheduling refreshes
     """
-    now = datetime.now(timezone.utc)
-    current_timestamp = get_current_15min_timestamp()
-    next_timestamp = current_timestamp + 900  # Add 15 minutes
-    
-    # Convert to datetime for calculation
-    next_dt = datetime.fromtimestamp(next_timestamp, timezone.utc)
-    delta = next_dt - now
-    
-    return int(delta.total_seconds())
-
-
+    return int(INTERVAL_SECONDS - time.time() % INTERVAL_SECONDS)
@@ -3,11 +3,19 @@ Wallet utilities for SafeProxy creation and management
 Complete working version with proper Safe deployment
 """
 import os
+import asyncio
 import logging
 import time
-from typing import Optional
-from web3 import Web3
+from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
 from eth_account import Account
+from eth_utils import keccak
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +30,18 @@ FALLBACK_HANDLER = "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"
 
 USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"  # USDC on Polygon
 
-# ProxyCreation event signature
-PROXY_CREATION_EVENT = '0x4f51faf6c4561ff95f067657e43439f0f856d97c04d9ec9070a6199ad418e235'
+# Multicall3 (same address on every EVM chain): batches many read calls into one eth_call
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL_BATCH_SIZE = 500  # calls per eth_call, keeps requests under RPC size/gas limits
+
+RECEIPT_POLL_INTERVAL = 1.0  # seconds between batched receipt polls
+
+# EIP-1559 fee snapshot lifetime (~1 Polygon block) and Polygon's minimum priority fee
+FEE_CACHE_SECONDS = 2.0
+MIN_PRIORITY_FEE_WEI = 30 * 10**9
+
+# Placeholder owner used to locate the owner slot in the setup() calldata template
+_TEMPLATE_OWNER = "0x" + "ff" * 20
 
 # Gnosis Safe ProxyFactory ABI
 PROXY_FACTORY_ABI = [
@@ -37,6 +55,13 @@ PROXY_FACTORY_ABI = [
         "outputs": [{"internalType": "contract GnosisSafeProxy", "name": "proxy", "type": "address"}],
         "stateMutability": "nonpayable",
         "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "proxyCreationCode",
+        "outputs": [{"internalType": "bytes", "name": "", "type": "bytes"}],
+        "stateMutability": "pure",
+        "type": "function"
     }
 ]
 
@@ -60,6 +85,38 @@ GNOSIS_SAFE_ABI = [
     }
 ]
 
+# Multicall3 ABI (aggregate3 function)
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
 # ERC20 ABI
 ERC20_ABI = [
     {
@@ -82,21 +139,37 @@ ERC20_ABI = [
 ]
 
 
-class WalletManager:
+class _WalletRegistry:
     """
-    Manages wallet operations including SafeProxy creation
+    Process-wide web3 connection, contracts and deployment config
+    
+    Built once per process (see _get_wallet_registry) so every WalletManager
+    shares one connection pool and the startup RPCs run a single time
     """
     
     def __init__(self):
-        """Initialize Web3 connection and contracts"""
-        self.w3 = Web3(Web3.HTTPProvider(POLYGON_RPC))
+        # One keep-alive pool shared by every sync RPC in the process
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=64)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        # Sync provider for startup checks and the sync helpers
+        self.w3 = Web3(Web3.HTTPProvider(POLYGON_RPC, session=session))
+        
+        # Async provider for everything called from the event loop, so RPCs don't block it
+        self.async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(POLYGON_RPC, request_kwargs={"timeout": 10}))
         
         # Check connection
         if not self.w3.is_connected():
             logger.error("❌ Not connected to Polygon network")
             raise Exception("Cannot connect to Polygon RPC")
         
-        logger.info(f"✅ Connected to Polygon (Chain ID: {self.w3.eth.chain_id})")
+        # Chain ID can't change under us; read it once instead of per transaction
+        self.chain_id = self.w3.eth.chain_id
+        logger.info("✅ Connected to Polygon (Chain ID: %s)", self.chain_id)
+        if self.chain_id != POLYGON_CHAIN_ID:
+            logger.warning("⚠️  RPC chain ID %s is not Polygon mainnet (%s)", self.chain_id, POLYGON_CHAIN_ID)
         
         # Initialize contracts
         self.safe_factory = self.w3.eth.contract(
@@ -114,6 +187,41 @@ class WalletManager:
             abi=ERC20_ABI
         )
         
+        self.multicall = self.w3.eth.contract(
+            address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+        
+        # Calldata templates for Safe deployment: only the owner and salt nonce vary,
+        # so ABI-encode once here and splice those fields in per deployment
+        zero_address = "0x0000000000000000000000000000000000000000"
+        setup_call = self.safe_master.functions.setup(
+            [Web3.to_checksum_address(_TEMPLATE_OWNER)],
+            1,  # threshold
+            zero_address,  # to
+            b'',  # data
+            Web3.to_checksum_address(FALLBACK_HANDLER),
+            zero_address,  # payment token
+            0,  # payment
+            zero_address  # payment receiver
+        )._encode_transaction_data()
+        self.setup_template = bytes.fromhex(setup_call[2:])
+        self.setup_owner_offset = self.setup_template.find(bytes.fromhex(_TEMPLATE_OWNER[2:]))
+        
+        create_proxy_call = self.safe_factory.functions.createProxyWithNonce(
+            Web3.to_checksum_address(SAFE_MASTER_COPY),
+            self.setup_template,
+            0
+        )._encode_transaction_data()
+        self.create_proxy_template = bytes.fromhex(create_proxy_call[2:])
+        self.create_proxy_salt_offset = 4 + 2 * 32  # selector, singleton, initializer offset
+        self.create_proxy_setup_offset = self.create_proxy_template.find(self.setup_template)
+        
+        # keccak(proxy creation code + singleton), for CREATE2 address prediction
+        creation_code = self.safe_factory.functions.proxyCreationCode().call()
+        singleton = bytes.fromhex(SAFE_MASTER_COPY[2:]).rjust(32, b"\0")
+        self.proxy_init_code_hash = keccak(creation_code + singleton)
+        
         # Load deployer private key
         self.deployer_key = os.getenv("DEPLOYER_PRIVATE_KEY")
         if not self.deployer_key:
@@ -121,16 +229,57 @@ class WalletManager:
             raise Exception("DEPLOYER_PRIVATE_KEY required for Safe deployment")
         
         self.deployer_account = Account.from_key(self.deployer_key)
-        logger.info(f"💰 Deployer account: {self.deployer_account.address}")
+        logger.info("💰 Deployer account: %s", self.deployer_account.address)
+        
+        # Deployer nonce tracked locally so sending a transaction doesn't need a
+        # get_transaction_count round-trip (loaded on first use, re-synced on send errors)
+        self.nonce_lock = asyncio.Lock()
+        self.local_nonce: Optional[int] = None
         
         # Check deployer balance
         balance = self.w3.eth.get_balance(self.deployer_account.address)
         balance_matic = balance / 10**18
-        logger.info(f"💎 Deployer MATIC balance: {balance_matic:.4f} MATIC")
+        logger.info("💎 Deployer MATIC balance: %.4f MATIC", balance_matic)
         
         if balance_matic < 0.01:
-            logger.warning(f"⚠️  Low MATIC balance! You have {balance_matic:.4f} MATIC")
-            logger.warning(f"⚠️  Need at least 0.01 MATIC to deploy Safes")
+            logger.warning("⚠️  Low MATIC balance! You have %.4f MATIC", balance_matic)
+            logger.warning("⚠️  Need at least 0.01 MATIC to deploy Safes")
+
+
+@lru_cache(maxsize=1)
+def _get_wallet_registry() -> _WalletRegistry:
+    """The process-wide wallet registry, created on first use"""
+    return _WalletRegistry()
+
+
+class WalletManager:
+    """
+    Manages wallet operations including SafeProxy creation
+    """
+    
+    def __init__(self):
+        """Attach to the shared Web3 connection and contracts (no RPCs after the first instance)"""
+        self._registry = _get_wallet_registry()
+        
+        self.w3 = self._registry.w3
+        self.async_w3 = self._registry.async_w3
+        self.chain_id = self._registry.chain_id
+        self.safe_factory = self._registry.safe_factory
+        self.safe_master = self._registry.safe_master
+        self.usdc_contract = self._registry.usdc_contract
+        self.multicall = self._registry.multicall
+        self.deployer_key = self._registry.deployer_key
+        self.deployer_account = self._registry.deployer_account
+        
+        # Shared pooled async HTTP client for read-only RPCs (injected at app startup)
+        self.http: Optional[httpx.AsyncClient] = None
+        
+        # Cached EIP-1559 fees: (fetched_at, max_fee_per_gas, max_priority_fee_per_gas)
+        self._fee_cache: Tuple[float, int, int] = (0.0, 0, 0)
+        
+        # Pending transaction receipts, polled together in one JSON-RPC batch per tick
+        self._receipt_waiters: Dict[str, List[asyncio.Future]] = {}
+        self._receipt_poller: Optional[asyncio.Task] = None
     
     async def create_safe_proxy(self, owner_address: str) -> str:
         """
@@ -144,166 +293,386 @@ class WalletManager:
         """
         owner_address = Web3.to_checksum_address(owner_address)
         
-        logger.info(f"🚀 Deploying Gnosis Safe for owner: {owner_address}")
-        logger.info(f"   Factory: {SAFE_FACTORY_ADDRESS}")
-        logger.info(f"   Master Copy: {SAFE_MASTER_COPY}")
-        
         # Generate unique salt nonce (timestamp + owner hash)
         salt_nonce = int(time.time() * 1000) + (int(owner_address, 16) % 1000000)
-        logger.info(f"🎲 Salt nonce: {salt_nonce}")
-        
-        # Prepare Safe setup parameters
-        owners = [owner_address]
-        threshold = 1
-        to_address = "0x0000000000000000000000000000000000000000"
-        data = b''
-        fallback_handler = Web3.to_checksum_address(FALLBACK_HANDLER)
-        payment_token = "0x0000000000000000000000000000000000000000"
-        payment = 0
-        payment_receiver = "0x0000000000000000000000000000000000000000"
-        
-        logger.info(f"📝 Safe configuration:")
-        logger.info(f"   Owner: {owner_address}")
-        logger.info(f"   Threshold: {threshold}")
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🚀 Deploying Gnosis Safe for owner: %s", owner_address)
+            logger.info("   Factory: %s", SAFE_FACTORY_ADDRESS)
+            logger.info("   Master Copy: %s", SAFE_MASTER_COPY)
+            logger.info("🎲 Salt nonce: %s", salt_nonce)
+            logger.info("   Threshold: 1")
         
         # Encode the setup call
-        setup_data = self.safe_master.functions.setup(
-            owners,
-            threshold,
-            to_address,
-            data,
-            fallback_handler,
-            payment_token,
-            payment,
-            payment_receiver
-        )._encode_transaction_data()
+        setup_data = self._encode_setup(owner_address)
+        
+        logger.info("✅ Setup data encoded (%s bytes)", len(setup_data))
         
-        logger.info(f"✅ Setup data encoded ({len(setup_data)} bytes)")
+        # The factory deploys with CREATE2, so the address is known before mining
+        safe_address = self.predict_safe_address(owner_address, salt_nonce, setup_data)
+        logger.info("🔮 Predicted Safe address: %s", safe_address)
         
         # Build deployment transaction
         logger.info("🔨 Building deployment transaction...")
         
-        gas_price = self.w3.eth.gas_price
-        logger.info(f"⛽ Gas price: {gas_price / 10**9:.2f} Gwei")
+        max_fee, priority_fee = await self._get_fees()
+        logger.info("⛽ Max fee: %.2f Gwei (tip %.2f Gwei)", max_fee / 10**9, priority_fee / 10**9)
         
-        tx = self.safe_factory.functions.createProxyWithNonce(
-            Web3.to_checksum_address(SAFE_MASTER_COPY),
-            setup_data,
-            salt_nonce
-        ).build_transaction({
+        tx = {
             'from': self.deployer_account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.deployer_account.address),
+            'to': self.safe_factory.address,
+            'data': self._encode_create_proxy(setup_data, salt_nonce),
+            'value': 0,
             'gas': 600000,
-            'gasPrice': gas_price,
-            'chainId': POLYGON_CHAIN_ID
-        })
+            'maxFeePerGas': max_fee,
+            'maxPriorityFeePerGas': priority_fee,
+            'type': 2,
+            'chainId': self.chain_id
+        }
         
-        estimated_cost = (tx['gas'] * tx['gasPrice']) / 10**18
-        logger.info(f"💰 Estimated cost: {estimated_cost:.6f} MATIC")
+        estimated_cost = (tx['gas'] * tx['maxFeePerGas']) / 10**18
+        logger.info("💰 Estimated cost: %.6f MATIC", estimated_cost)
         
-        # Sign transaction
-        logger.info("✍️  Signing transaction...")
-        signed_tx = self.w3.eth.account.sign_transaction(tx, self.deployer_key)
-        
-        # Send to blockchain
-        logger.info("📤 Sending transaction to Polygon...")
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
+        # Reserve the nonce last, and release it if signing or sending fails,
+        # so a failed attempt can't leave a gap that stalls later transactions
+        try:
+            tx['nonce'] = await self._next_nonce()
+            
+            logger.info("✍️  Signing transaction...")
+            signed_tx = self.w3.eth.account.sign_transaction(tx, self.deployer_key)
+            
+            logger.info("📤 Sending transaction to Polygon...")
+            tx_hash = await self.async_w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception:
+            await self._reset_nonce()
+            raise
+        tx_hash_hex = Web3.to_hex(tx_hash)
         
-        logger.info(f"⏳ Transaction sent: {tx_hash_hex}")
-        logger.info(f"🔗 Polygonscan: https://polygonscan.com/tx/{tx_hash_hex}")
+        logger.info("⏳ Transaction sent: %s", tx_hash_hex)
+        logger.info("🔗 Polygonscan: https://polygonscan.com/tx/%s", tx_hash_hex)
         
         # Wait for confirmation
         logger.info("⏳ Waiting for confirmation...")
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        try:
+            receipt = await self.wait_for_receipt(tx_hash_hex, timeout=120)
+        except Exception:
+            # Dropped or stuck: re-sync so the next transaction doesn't queue behind it
+            await self._reset_nonce()
+            raise
         
         if receipt['status'] != 1:
-            logger.error(f"❌ Transaction REVERTED!")
-            logger.error(f"Gas used: {receipt['gasUsed']}")
+            logger.error("❌ Transaction REVERTED!")
+            logger.error("Gas used: %s", receipt['gasUsed'])
             raise Exception(f"Safe deployment failed. TX: https://polygonscan.com/tx/{tx_hash_hex}")
         
         logger.info("✅ Transaction confirmed!")
         
-        # Extract Safe address from ProxyCreation event
-        safe_address = None
-        
-        for log in receipt['logs']:
-            try:
-                # Look for ProxyCreation event from Safe factory
-                # Event: ProxyCreation(address indexed proxy, address singleton)
-                if (log['address'].lower() == SAFE_FACTORY_ADDRESS.lower() and
-                    len(log['topics']) > 0 and 
-                    log['topics'][0].hex() == PROXY_CREATION_EVENT):
-                    
-                    # The proxy address is in the data field
-                    # Format: 0x + padding + proxy_address (40 chars) + singleton_address (40 chars)
-                    data_hex = log['data'].hex()
-                    
-                    # Remove '0x' prefix if present
-                    if data_hex.startswith('0x'):
-                        data_hex = data_hex[2:]
-                    
-                    # Extract proxy address (first 32 bytes, last 40 chars are the address)
-                    proxy_hex = '0x' + data_hex[24:64]
-                    safe_address = Web3.to_checksum_address(proxy_hex)
-                    
-                    logger.info(f"✅ Found Safe in ProxyCreation event")
-                    logger.info(f"   Safe Address: {safe_address}")
-                    break
-                    
-            except Exception as e:
-                logger.debug(f"Error parsing log: {e}")
-                continue
-        
-        if not safe_address:
-            # Fallback: Try to find any contract creation in the receipt
-            logger.warning("Could not find ProxyCreation event, checking all logs...")
-            
-            for log in receipt['logs']:
-                try:
-                    # Look for any log from the factory
-                    if log['address'].lower() == SAFE_FACTORY_ADDRESS.lower():
-                        data_hex = log['data'].hex()
-                        if data_hex.startswith('0x'):
-                            data_hex = data_hex[2:]
-                        
-                        # Try to extract an address from data
-                        if len(data_hex) >= 64:
-                            potential_address = '0x' + data_hex[24:64]
-                            if potential_address.startswith('0x0'):
-                                # Try next 64 chars
-                                potential_address = '0x' + data_hex[88:128] if len(data_hex) >= 128 else potential_address
-                            
-                            try:
-                                safe_address = Web3.to_checksum_address(potential_address)
-                                logger.info(f"✅ Extracted address from fallback: {safe_address}")
-                                break
-                            except:
-                                continue
-                except Exception as e:
-                    continue
-        
-        if not safe_address:
-            logger.error("❌ Could not extract Safe address from logs!")
-            logger.error(f"All logs: {receipt['logs']}")
-            raise Exception("Could not determine deployed Safe address")
-        
         # Calculate actual cost
-        actual_cost = (receipt['gasUsed'] * tx['gasPrice']) / 10**18
-        logger.info(f"💰 Actual cost: {actual_cost:.6f} MATIC (~${actual_cost * 0.9:.4f})")
-        logger.info(f"✅ Safe DEPLOYED: {safe_address}")
-        logger.info(f"🔗 View Safe: https://polygonscan.com/address/{safe_address}")
+        actual_cost = (receipt['gasUsed'] * receipt['effectiveGasPrice']) / 10**18
+        logger.info("💰 Actual cost: %.6f MATIC (~$%.4f)", actual_cost, actual_cost * 0.9)
+        logger.info("✅ Safe DEPLOYED: %s", safe_address)
+        logger.info("🔗 View Safe: https://polygonscan.com/address/%s", safe_address)
         
         # Verify deployment
-        code = self.w3.eth.get_code(safe_address)
+        code = await self.async_w3.eth.get_code(safe_address)
         if code == b'' or code == '0x':
             logger.error("❌ Safe address has no code!")
             raise Exception("Safe deployment verification failed")
         
-        logger.info(f"✅ Safe verified on-chain (code: {len(code)} bytes)")
+        logger.info("✅ Safe verified on-chain (code: %s bytes)", len(code))
         
         return safe_address
     
+    async def create_safe_proxies_bulk(self, owner_addresses: List[str], wait: bool = True) -> List[str]:
+        """
+        Deploy one Gnosis Safe per owner, sending all deployments at once
+        
+        The deployer nonce is fetched once and incremented locally, so every
+        transaction is signed up front and broadcast concurrently instead of
+        waiting for each one to be mined before sending the next
+        
+        Args:
+            owner_addresses: EOA addresses that will own the Safes
+            wait: Wait for (and verify) all deployments before returning
+            
+        Returns:
+            Safe addresses in input order (predicted via CREATE2)
+        """
+        owners = [Web3.to_checksum_address(owner) for owner in owner_addresses]
+        if not owners:
+            return []
+        
+        logger.info("🚀 Deploying %s Gnosis Safes", len(owners))
+        
+        max_fee, priority_fee = await self._get_fees()
+        timestamp_ms = int(time.time() * 1000)
+        
+        safe_addresses = []
+        txs = []
+        for i, owner in enumerate(owners):
+            # Offset by index so identical owners in one batch still get distinct Safes
+            salt_nonce = timestamp_ms + (int(owner, 16) % 1000000) + i
+            setup_data = self._encode_setup(owner)
+            safe_addresses.append(self.predict_safe_address(owner, salt_nonce, setup_data))
+            
+            tx = {
+                'from': self.deployer_account.address,
+                'to': self.safe_factory.address,
+                'data': self._encode_create_proxy(setup_data, salt_nonce),
+                'value': 0,
+                'gas': 600000,
+                'maxFeePerGas': max_fee,
+                'maxPriorityFeePerGas': priority_fee,
+                'type': 2,
+                'chainId': self.chain_id
+            }
+            txs.append(tx)
+        
+        # Reserve nonces only once every transaction is built, and release them
+        # if signing or broadcasting fails so no gap is left behind
+        try:
+            base_nonce = await self._next_nonce(len(owners))
+            signed_txs = []
+            for i, tx in enumerate(txs):
+                tx['nonce'] = base_nonce + i
+                signed_txs.append(self.w3.eth.account.sign_transaction(tx, self.deployer_key))
+            
+            # Broadcast in parallel; the nonces already fix their order on-chain
+            tx_hashes = await asyncio.gather(*(
+                self.async_w3.eth.send_raw_transaction(signed.raw_transaction)
+                for signed in signed_txs
+            ))
+        except Exception:
+            await self._reset_nonce()
+            raise
+        tx_hashes = [Web3.to_hex(tx_hash) for tx_hash in tx_hashes]
+        logger.info("⏳ Sent %s Safe deployments (nonces %s-%s)", len(tx_hashes), base_nonce, base_nonce + len(owners) - 1)
+        
+        if wait:
+            try:
+                receipts = await self.wait_many(tx_hashes, timeout=120)
+            except Exception:
+                await self._reset_nonce()
+                raise
+            failed = [h for h in tx_hashes if receipts[h]['status'] != 1]
+            if failed:
+                raise Exception(f"{len(failed)} Safe deployments failed: {', '.join(failed)}")
+            logger.info("✅ Deployed %s Safes", len(owners))
+        
+        return safe_addresses
+    
+    async def _rpc(self, method: str, params: list):
+        """
+        Send a JSON-RPC request over the shared async HTTP client
+        
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+            
+        Returns:
+            The "result" field of the response
+        """
+        response = await self.http.post(POLYGON_RPC, json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": method,
+            "params": params
+        })
+        response.raise_for_status()
+        payload = response.json()
+        if "error" in payload:
+            raise Exception(f"RPC error: {payload['error']}")
+        return payload["result"]
+    
+    async def _next_nonce(self, count: int = 1) -> int:
+        """Reserve `count` consecutive deployer nonces and return the first"""
+        registry = self._registry
+        async with registry.nonce_lock:
+            if registry.local_nonce is None:
+                registry.local_nonce = await self.async_w3.eth.get_transaction_count(
+                    self.deployer_account.address, "pending"
+                )
+            nonce = registry.local_nonce
+            registry.local_nonce += count
+            return nonce
+    
+    async def _reset_nonce(self) -> None:
+        """
+        Drop the local nonce after a failed or unconfirmed send
+        
+        The next reservation re-reads the node's pending count, which fills any
+        nonce a failed transaction left unused. Makes no RPC itself, so it can't
+        fail and mask the original error
+        """
+        registry = self._registry
+        async with registry.nonce_lock:
+            registry.local_nonce = None
+    
+    async def _get_fees(self) -> Tuple[int, int]:
+        """
+        EIP-1559 (maxFeePerGas, maxPriorityFeePerGas) from a cached eth_feeHistory snapshot
+        
+        Refreshed at most once per FEE_CACHE_SECONDS, so transactions sent in the
+        same block share one RPC instead of an eth_gasPrice call each
+        """
+        fetched_at, max_fee, priority_fee = self._fee_cache
+        if time.monotonic() - fetched_at < FEE_CACHE_SECONDS:
+            return max_fee, priority_fee
+        
+        history = await self.async_w3.eth.fee_history(5, "latest", [50])
+        base_fee = history["baseFeePerGas"][-1]  # base fee of the next block
+        rewards = sorted(reward[0] for reward in history["reward"])
+        priority_fee = max(rewards[len(rewards) // 2] if rewards else 0, MIN_PRIORITY_FEE_WEI)
+        max_fee = 2 * base_fee + priority_fee
+        
+        self._fee_cache = (time.monotonic(), max_fee, priority_fee)
+        return max_fee, priority_fee
+    
+    def _encode_setup(self, owner_address: str) -> bytes:
+        """Setup() initializer for owner_address, spliced into the precomputed template"""
+        offset = self._registry.setup_owner_offset
+        buf = bytearray(self._registry.setup_template)
+        buf[offset:offset + 20] = bytes.fromhex(owner_address[2:])
+        return bytes(buf)
+    
+    def _encode_create_proxy(self, setup_data: bytes, salt_nonce: int) -> bytes:
+        """createProxyWithNonce calldata, spliced into the precomputed template"""
+        salt_offset = self._registry.create_proxy_salt_offset
+        setup_offset = self._registry.create_proxy_setup_offset
+        buf = bytearray(self._registry.create_proxy_template)
+        buf[salt_offset:salt_offset + 32] = salt_nonce.to_bytes(32, "big")
+        buf[setup_offset:setup_offset + len(setup_data)] = setup_data
+        return bytes(buf)
+    
+    def predict_safe_address(
+        self,
+        owner_address: str,
+        salt_nonce: int,
+        setup_data: Optional[bytes] = None
+    ) -> str:
+        """
+        Compute the address createProxyWithNonce will deploy to (CREATE2)
+        
+        Args:
+            owner_address: The Safe owner's address
+            salt_nonce: Salt nonce passed to createProxyWithNonce
+            setup_data: Pre-encoded setup() initializer, if already built
+            
+        Returns:
+            Checksum address of the (future) Safe
+        """
+        if setup_data is None:
+            setup_data = self._encode_setup(Web3.to_checksum_address(owner_address))
+        salt = keccak(keccak(setup_data) + salt_nonce.to_bytes(32, "big"))
+        factory = bytes.fromhex(SAFE_FACTORY_ADDRESS[2:])
+        return Web3.to_checksum_address(keccak(b"\xff" + factory + salt + self._registry.proxy_init_code_hash)[12:])
+    
+    async def _rpc_batch(self, calls: List[tuple]) -> list:
+        """
+        Send several JSON-RPC requests in one HTTP round-trip
+        
+        Args:
+            calls: List of (method, params) tuples
+            
+        Returns:
+            Results in call order (None for calls that errored or returned null)
+        """
+        if self.http:
+            response = await self.http.post(POLYGON_RPC, json=[
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(calls)
+            ])
+            response.raise_for_status()
+            payload = response.json()
+        else:
+            payload = await self.async_w3.provider.make_batch_request(calls)
+        
+        if isinstance(payload, dict):
+            # Whole batch rejected (e.g. provider without batch support)
+            raise Exception(f"RPC error: {payload.get('error', payload)}")
+        
+        results = [None] * len(calls)
+        for i, item in enumerate(payload):
+            index = item.get("id", i)
+            if isinstance(index, int) and 0 <= index < len(calls):
+                results[index] = item.get("result")
+        return results
+    
+    async def wait_for_receipt(self, tx_hash: str, timeout: float = 120) -> dict:
+        """
+        Wait for a transaction to be mined
+        
+        Concurrent waits share one polling loop that checks every pending hash
+        with a single batched eth_getTransactionReceipt request per tick
+        
+        Args:
+            tx_hash: Transaction hash (hex)
+            timeout: Seconds to wait before giving up
+            
+        Returns:
+            Transaction receipt
+        """
+        fut = asyncio.get_running_loop().create_future()
+        self._receipt_waiters.setdefault(tx_hash, []).append(fut)
+        
+        if self._receipt_poller is None:
+            self._receipt_poller = asyncio.create_task(self._poll_receipts())
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(fut), timeout)
+        except asyncio.TimeoutError:
+            waiters = self._receipt_waiters.get(tx_hash, [])
+            if fut in waiters:
+                waiters.remove(fut)
+                if not waiters:
+                    del self._receipt_waiters[tx_hash]
+            raise Exception(f"Transaction {tx_hash} not mined after {timeout}s")
+    
+    async def wait_many(self, tx_hashes: List[str], timeout: float = 120) -> Dict[str, dict]:
+        """
+        Wait for several transactions to be mined, polling them together
+        
+        Args:
+            tx_hashes: Transaction hashes (hex)
+            timeout: Seconds to wait for each transaction
+            
+        Returns:
+            Dict of tx hash -> receipt
+        """
+        receipts = await asyncio.gather(*(self.wait_for_receipt(h, timeout) for h in tx_hashes))
+        return dict(zip(tx_hashes, receipts))
+    
+    async def _poll_receipts(self) -> None:
+        """Poll all pending receipts in one batch per tick until none are left"""
+        try:
+            while self._receipt_waiters:
+                await asyncio.sleep(RECEIPT_POLL_INTERVAL)
+                
+                hashes = list(self._receipt_waiters)
+                try:
+                    results = await self._rpc_batch(
+                        [("eth_getTransactionReceipt", [h]) for h in hashes]
+                    )
+                except Exception as e:
+                    logger.debug("Receipt poll failed: %s", e)
+                    continue
+                
+                for tx_hash, raw in zip(hashes, results):
+                    if raw is None:
+                        continue
+                    # Mined: apply web3's receipt formatting to the batch result directly
+                    # rather than fetching the same receipt again
+                    try:
+                        receipt = AttributeDict.recursive(receipt_formatter(raw))
+                    except Exception as e:
+                        logger.debug("Error formatting receipt %s: %s", tx_hash, e)
+                        continue
+                    for fut in self._receipt_waiters.pop(tx_hash, []):
+                        if not fut.done():
+                            fut.set_result(receipt)
+        finally:
+            self._receipt_poller = None
+    
     async def check_usdc_balance(self, address: str) -> float:
         """
         Check USDC balance of an address
@@ -316,14 +685,63 @@ class WalletManager:
         """
         try:
             address = Web3.to_checksum_address(address)
-            balance_wei = self.usdc_contract.functions.balanceOf(address).call()
+            call_data = self.usdc_contract.functions.balanceOf(address)._encode_transaction_data()
+            if self.http:
+                result = await self._rpc("eth_call", [{"to": self.usdc_contract.address, "data": call_data}, "latest"])
+                balance_wei = int(result, 16)
+            else:
+                result = await self.async_w3.eth.call({"to": self.usdc_contract.address, "data": call_data})
+                balance_wei = int.from_bytes(result, "big")
             balance_usdc = balance_wei / 10**6
-            logger.info(f"💵 USDC balance for {address}: {balance_usdc:.2f}")
+            logger.info("💵 USDC balance for %s: %.2f", address, balance_usdc)
             return balance_usdc
         except Exception as e:
-            logger.error(f"Error checking USDC balance: {str(e)}")
+            logger.error("Error checking USDC balance: %s", e)
             return 0.0
     
+    async def check_usdc_balances_bulk(self, addresses: List[str]) -> Dict[str, float]:
+        """
+        Check USDC balances of many addresses with one Multicall3 eth_call per batch
+        
+        Args:
+            addresses: Ethereum addresses to check
+            
+        Returns:
+            Dict of checksum address -> USDC balance (0.0 where the call failed)
+        """
+        checksummed = list(dict.fromkeys(Web3.to_checksum_address(a) for a in addresses))
+        balances = {address: 0.0 for address in checksummed}
+        
+        for start in range(0, len(checksummed), MULTICALL_BATCH_SIZE):
+            batch = checksummed[start:start + MULTICALL_BATCH_SIZE]
+            calls = [
+                (
+                    self.usdc_contract.address,
+                    True,
+                    self.usdc_contract.functions.balanceOf(address)._encode_transaction_data()
+                )
+                for address in batch
+            ]
+            
+            try:
+                call_data = self.multicall.functions.aggregate3(calls)._encode_transaction_data()
+                if self.http:
+                    raw = await self._rpc("eth_call", [{"to": self.multicall.address, "data": call_data}, "latest"])
+                    raw = bytes.fromhex(raw[2:])
+                else:
+                    raw = await self.async_w3.eth.call({"to": self.multicall.address, "data": call_data})
+                (results,) = self.w3.codec.decode(["(bool,bytes)[]"], raw)
+            except Exception as e:
+                logger.error("Error checking USDC balances: %s", e)
+                continue
+            
+            for address, (success, return_data) in zip(batch, results):
+                if success and len(return_data) >= 32:
+                    balances[address] = int.from_bytes(return_data[-32:], "big") / 10**6
+        
+        logger.info("💵 Checked USDC balances for %s addresses", len(checksummed))
+        return balances
+    
     async def is_valid_safe(self, address: str) -> bool:
         """
         Check if address is a deployed contract
@@ -336,12 +754,12 @@ class WalletManager:
         """
         try:
             address = Web3.to_checksum_address(address)
-            code = self.w3.eth.get_code(address)
+            code = await self.async_w3.eth.get_code(address)
             return code != b'' and code != '0x'
         except:
             return False
     
-    def approve_usdc_spending(self, spender: str, amount: float) -> str:
+    async def approve_usdc_spending(self, spender: str, amount: float) -> str:
         """
         Approve USDC spending
         
@@ -355,28 +773,37 @@ class WalletManager:
         try:
             spender = Web3.to_checksum_address(spender)
             amount_wei = int(amount * 10**6)
+            max_fee, priority_fee = await self._get_fees()
             
-            logger.info(f"Approving {amount} USDC for {spender}")
+            logger.info("Approving %s USDC for %s", amount, spender)
             
-            tx = self.usdc_contract.functions.approve(
-                spender,
-                amount_wei
-            ).build_transaction({
+            tx = {
                 'from': self.deployer_account.address,
-                'nonce': self.w3.eth.get_transaction_count(self.deployer_account.address),
+                'to': self.usdc_contract.address,
+                'data': self.usdc_contract.functions.approve(spender, amount_wei)._encode_transaction_data(),
+                'value': 0,
                 'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
-                'chainId': POLYGON_CHAIN_ID
-            })
+                'maxFeePerGas': max_fee,
+                'maxPriorityFeePerGas': priority_fee,
+                'type': 2,
+                'chainId': self.chain_id
+            }
             
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.deployer_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            # Nonce reserved last and released on any failure (see create_safe_proxy)
+            try:
+                tx['nonce'] = await self._next_nonce()
+                signed_tx = self.w3.eth.account.sign_transaction(tx, self.deployer_key)
+                tx_hash = await self.async_w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            except Exception:
+                await self._reset_nonce()
+                raise
             
-            logger.info(f"✅ USDC approval sent: {tx_hash.hex()}")
-            return tx_hash.hex()
+            tx_hash_hex = Web3.to_hex(tx_hash)
+            logger.info("✅ USDC approval sent: %s", tx_hash_hex)
+            return tx_hash_hex
             
         except Exception as e:
-            logger.error(f"Error approving USDC: {str(e)}")
+            logger.error("Error approving USDC: %s", e)
             raise
     
     def get_transaction_receipt(self, tx_hash: str) -> dict:
@@ -393,5 +820,15 @@ class WalletManager:
             receipt = self.w3.eth.get_transaction_receipt(tx_hash)
             return dict(receipt)
         except Exception as e:
-            logger.error(f"Error getting receipt: {str(e)}")
-            raise
\ No newline at end of file
+            logger.error("Error getting receipt: %s", e)
+            raise
+    
+    async def close(self) -> None:
+        """Release the async provider's pooled connections"""
+        try:
+            await self.async_w3.provider.disconnect()
+        except NotImplementedError:
+            # AsyncHTTPProvider only implements disconnect() from web3 7.8
+            pass
+        except Exception as e:
+            logger.warning("Error disconnecting async provider: %s", e)